@@ -0,0 +1,679 @@
+import argparse
+import bisect
+import copy
+import itertools
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+from ifr_conditions import compile_conditions, OP_EQ, OP_IN, OP_AND, OP_OR, OP_NOT, OP_TRUE
+from main import get_paths
+
+
+class BiosEngine:
+    """
+    Headless Nachbau des BIOS-Objekts aus bios_template.html.
+    Gleiche Semantik wie handleMenuInput/handleEnter/goBack/commitModalSelection/saveAndExit,
+    aber auf einem Config-Dict statt auf dem DOM. Views und Zeilen werden einmal indexiert.
+    """
+    def __init__(self, config):
+        self.data = copy.deepcopy(config)
+        self.views = {}        # View-ID -> Liste von Zeilen (dict)
+        self.view_paths = {}   # View-ID -> Breadcrumb
+        self.tab_views = []    # Tab-Index -> View-ID
+        self.view_tabs = {}    # View-ID -> Tab-Index
+        self.cond_rows = {}    # Target-Index -> Zeile (ein Target pro Vorkommen)
+        self.occurrences = {}  # Item-ID -> Zeilen (gleiche Variable an mehreren Stellen)
+        self.id_map = {}
+
+        # Vor dem Indexieren kompilieren: Zeilen bekommen ihren Target-Index ("_cond")
+        self.conditions = compile_conditions(self.data.get('tabs', []))
+        for index, tab in enumerate(self.data.get('tabs', [])):
+            view_id = f"tab-view-{index}"
+            self.tab_views.append(view_id)
+            self._index_view(view_id, tab.get('items', []), tab.get('name', ''), None, str(index))
+
+        self._init_conditions()
+        self._original_values = {item_id: item.get('value') for item_id, item in self.id_map.items()}
+
+        # Startzustand der Bedingungen einmal berechnen; reset() stellt nur
+        # die seitdem geänderten Targets wieder her
+        self.hidden = set()    # Target-Indizes (pro Vorkommen, wie data-cond im Template)
+        self.grayed = set()
+        self._visible_cache = {}
+        self._hidden_positions = {}  # View-ID -> sortierte Positionen versteckter Zeilen
+        self._dirty = set()
+        if self.conditions:
+            for ti in range(len(self.conditions["t"])):
+                self._apply_target(ti)
+        self._dirty_slots = set()
+        self._initial_hidden = frozenset(self.hidden)
+        self._initial_grayed = frozenset(self.grayed)
+        self._dirty = set()
+        self.reset()
+
+    # --- INDEX ---
+
+    def _index_view(self, view_id, items, path_label, parent_row, index_path):
+        self.view_tabs[view_id] = self.view_tabs[parent_row["view"]] if parent_row else len(self.tab_views) - 1
+        rows = []
+        for position, item in enumerate(items):
+            # Gleiches ID-Schema wie BiosHtmlGenerator._generate_items_html (Index-Pfad),
+            # damit Export und Skripte zur generierten Seite passen
+            item_path = f"{index_path}-{position}"
+            if "id" not in item:
+                item["id"] = f"item-{item_path}"
+            self.id_map[item["id"]] = item
+            cond = item.get("_cond")
+
+            row = {
+                "id": item["id"],
+                "type": item.get("type", "item"),
+                "target": f"view-{item_path}" if item.get("type") == "submenu" else None,
+                "options": item.get("options"),
+                "label": item.get("label", "N/A"),
+                "cond": cond,
+                "view": view_id,
+                "pos": position,       # Position ohne Bedingungen
+                "parent": parent_row   # Submenü-Zeile, über die man hierher kommt
+            }
+            if cond is not None:
+                self.cond_rows[cond] = row
+            rows.append(row)
+            self.occurrences.setdefault(item["id"], []).append(row)
+            if row["target"]:
+                self._index_view(row["target"], item.get("items", []),
+                                 f"{path_label} > {item.get('label', '')}", row, item_path)
+        self.views[view_id] = rows
+        self.view_paths[view_id] = path_label
+
+    def _init_conditions(self):
+        self.cond_slots = {}
+        self.cond_values = []
+        self.cond_results = []
+        self._initial_cond_values = []
+        self._initial_cond_results = []
+        c = self.conditions
+        if not c:
+            return
+        for slot, item_id in enumerate(c["q"]):
+            if item_id:
+                self.cond_slots[item_id] = slot
+        self.cond_slot_lists = [[] for _ in c["c"]]  # Bedingung -> Slots (Umkehrung von "d")
+        for slot, conds in enumerate(c["d"]):
+            for ci in conds:
+                self.cond_slot_lists[ci].append(slot)
+
+        self.cond_values = [
+            self._cond_value_of(slot, self.id_map[item_id].get('value')) if item_id in self.id_map else c["v"][slot]
+            for slot, item_id in enumerate(c["q"])
+        ]
+        self.cond_results = [self._eval_condition(ci) for ci in range(len(c["c"]))]
+        self._initial_cond_values = list(self.cond_values)
+        self._initial_cond_results = list(self.cond_results)
+
+    # --- STATE ---
+
+    def reset(self):
+        """Zurück auf den Startzustand (nur geänderte Werte werden zurückgesetzt)."""
+        for item_id in getattr(self, 'changes', {}):
+            self.id_map[item_id]["value"] = self._original_values[item_id]
+        self.changes = {}
+        self.display = {}      # Item-ID -> angezeigter Wert (innerText der Zeilen)
+        self.saves = []        # Änderungen zum Zeitpunkt jedes Save & Exit
+
+        for slot in self._dirty_slots:
+            self.cond_values[slot] = self._initial_cond_values[slot]
+            for ci in self.conditions["d"][slot]:
+                self.cond_results[ci] = self._initial_cond_results[ci]
+        self._dirty_slots = set()
+        # Nur Targets zurücksetzen, die sich seit dem letzten reset geändert haben
+        for ti in self._dirty:
+            if (ti in self.hidden) != (ti in self._initial_hidden):
+                self._set_hidden(ti, ti in self._initial_hidden)
+            self._set_member(self.grayed, ti, ti in self._initial_grayed)
+        self._dirty = set()
+
+        self.state = {
+            "tab_index": 0,
+            "view_stack": [],
+            "current_view": None,
+            "row_index": 0,
+            "modal_open": False,
+            "save_open": False,
+            "save_yes": False,
+            "modal_options": [],
+            "modal_index": 0,
+            "active_row": None
+        }
+        if self.tab_views:
+            self.switch_tab(0)
+
+    def visible_rows(self, view_id):
+        rows = self._visible_cache.get(view_id)
+        if rows is None:
+            rows = [row for row in self.views.get(view_id, []) if row["cond"] not in self.hidden]
+            self._visible_cache[view_id] = rows
+        return rows
+
+    def _row_index(self, view_id, row):
+        """
+        Position einer Zeile unter den sichtbaren Zeilen (None, wenn versteckt).
+        Ohne die Liste neu zu bauen: Position minus versteckte Zeilen davor.
+        """
+        if row["cond"] in self.hidden:
+            return None
+        hidden = self._hidden_positions.get(view_id)
+        return row["pos"] - bisect.bisect_left(hidden, row["pos"]) if hidden else row["pos"]
+
+    def _set_hidden(self, ti, hidden):
+        row = self.cond_rows[ti]
+        positions = self._hidden_positions.setdefault(row["view"], [])
+        if hidden:
+            self.hidden.add(ti)
+            bisect.insort(positions, row["pos"])
+        else:
+            self.hidden.discard(ti)
+            positions.remove(row["pos"])
+        self._visible_cache.pop(row["view"], None)
+
+    @staticmethod
+    def _set_member(target_set, key, present):
+        if present:
+            target_set.add(key)
+        else:
+            target_set.discard(key)
+
+    # --- NAVIGATION ---
+
+    def switch_tab(self, index):
+        if index < 0:
+            index = len(self.tab_views) - 1
+        if index >= len(self.tab_views):
+            index = 0
+        self.state["tab_index"] = index
+        self.state["view_stack"] = []
+        self.activate_view(self.tab_views[index])
+
+    def activate_view(self, view_id):
+        if view_id in self.views:
+            self.state["current_view"] = view_id
+            self.state["row_index"] = 0
+            self._clamp_row()
+
+    def _clamp_row(self):
+        # Wie renderRowSelection: erst nach oben, dann nach unten begrenzen
+        view_id = self.state["current_view"]
+        count = len(self.views.get(view_id, ())) - len(self._hidden_positions.get(view_id, ()))
+        if self.state["row_index"] >= count:
+            self.state["row_index"] = count - 1
+        if self.state["row_index"] < 0:
+            self.state["row_index"] = 0
+
+    def current_row(self):
+        rows = self.visible_rows(self.state["current_view"])
+        index = self.state["row_index"]
+        return rows[index] if 0 <= index < len(rows) else None
+
+    def handle_enter(self):
+        row = self.current_row()
+        if row is None or row["cond"] in self.grayed:
+            return
+
+        if row["type"] == "submenu":
+            self.state["view_stack"].append((self.state["current_view"], self.state["row_index"]))
+            self.activate_view(row["target"])
+        elif row["type"] == "select":
+            opts = row["options"] or []
+            if not opts:
+                return
+            self.state["active_row"] = row
+            self.state["modal_options"] = opts
+            current = self.display.get(row["id"], self.id_map[row["id"]].get("value"))
+            self.state["modal_index"] = opts.index(current) if current in opts else 0
+            self.state["modal_open"] = True
+
+    def go_back(self):
+        if self.state["view_stack"]:
+            view_id, row_index = self.state["view_stack"].pop()
+            self.activate_view(view_id)
+            self.state["row_index"] = row_index
+            self._clamp_row()
+        else:
+            self.toggle_save_dialog(True)
+
+    # --- MODAL ---
+
+    def update_modal_selection(self, direction):
+        count = len(self.state["modal_options"])
+        if not count:
+            return
+        index = self.state["modal_index"] + direction
+        self.state["modal_index"] = max(0, min(index, count - 1))
+
+    def commit_modal_selection(self):
+        row = self.state["active_row"]
+        self._set_value(row["id"], self.state["modal_options"][self.state["modal_index"]])
+
+        # Sichtbare Zeilen können sich verschoben haben
+        index = self._row_index(self.state["current_view"], row)
+        if index is not None:
+            self.state["row_index"] = index
+        self._clamp_row()
+        self.state["modal_open"] = False
+
+    def _set_value(self, item_id, val):
+        if item_id in self.id_map:
+            self.id_map[item_id]["value"] = val
+            self.display[item_id] = val
+            self.changes[item_id] = val
+        self._update_conditions(item_id, val)
+
+    # --- SAVE DIALOG ---
+
+    def toggle_save_dialog(self, show):
+        self.state["save_open"] = show
+        self.state["save_yes"] = False
+
+    def save_and_exit(self):
+        self.state["save_open"] = False
+        self.saves.append(dict(self.changes))
+        self.switch_tab(0)
+
+    # --- CONDITIONS (gleiche Auswertung wie im Template) ---
+
+    def _cond_value_of(self, slot, label):
+        return self.conditions["m"][slot].get(label)
+
+    def _eval_condition(self, ci):
+        program = self.conditions["p"]
+        values = self.cond_values
+        pc, end = self.conditions["c"][ci]
+        stack = []
+        while pc < end:
+            op = program[pc]
+            pc += 1
+            if op == OP_EQ:
+                stack.append(values[program[pc]] == program[pc + 1])
+                pc += 2
+            elif op == OP_IN:
+                count = program[pc + 1]
+                stack.append(values[program[pc]] in program[pc + 2:pc + 2 + count])
+                pc += 2 + count
+            elif op == OP_AND:
+                right = stack.pop()
+                stack.append(stack.pop() and right)
+            elif op == OP_OR:
+                right = stack.pop()
+                stack.append(stack.pop() or right)
+            elif op == OP_NOT:
+                stack.append(not stack.pop())
+            else:
+                stack.append(op == OP_TRUE)
+        return bool(stack) and stack.pop() is True
+
+    def _apply_target(self, ti):
+        target = self.conditions["t"][ti]
+        hidden = grayed = False
+        for ci, kind in zip(target[1::2], target[2::2]):
+            if not self.cond_results[ci]:
+                continue
+            if kind == 0:
+                hidden = True
+            else:
+                grayed = True
+
+        if hidden != (ti in self.hidden):
+            self._set_hidden(ti, hidden)
+            self._dirty.add(ti)
+        if grayed != (ti in self.grayed):
+            self._set_member(self.grayed, ti, grayed)
+            self._dirty.add(ti)
+
+    def _update_conditions(self, item_id, val):
+        slot = self.cond_slots.get(item_id)
+        if slot is None:
+            return
+        self.cond_values[slot] = self._cond_value_of(slot, val)
+        self._dirty_slots.add(slot)
+
+        targets = set()
+        for ci in self.conditions["d"][slot]:
+            result = self._eval_condition(ci)
+            if result == self.cond_results[ci]:
+                continue
+            self.cond_results[ci] = result
+            targets.update(self.conditions["x"][ci])
+        for ti in targets:
+            self._apply_target(ti)
+
+    # --- INPUT (Dispatcher wie setupInput) ---
+
+    def press(self, key):
+        if self.state["modal_open"]:
+            self._handle_modal_input(key)
+        elif self.state["save_open"]:
+            self._handle_save_input(key)
+        else:
+            self._handle_menu_input(key)
+
+    def _handle_modal_input(self, key):
+        if key == 'ArrowUp': self.update_modal_selection(-1)
+        elif key == 'ArrowDown': self.update_modal_selection(1)
+        elif key == 'Enter': self.commit_modal_selection()
+        elif key == 'Escape': self.state["modal_open"] = False
+
+    def _handle_save_input(self, key):
+        lower = key.lower()
+        if lower in ('arrowleft', 'arrowright', 'y', 'n'):
+            self.state["save_yes"] = lower == 'y' or (lower != 'n' and not self.state["save_yes"])
+        elif key == 'Enter':
+            if self.state["save_yes"]:
+                self.save_and_exit()
+            else:
+                self.toggle_save_dialog(False)
+        elif key == 'Escape':
+            self.toggle_save_dialog(False)
+
+    def _handle_menu_input(self, key):
+        s = self.state
+        if key == 'ArrowRight' and not s["view_stack"]: self.switch_tab(s["tab_index"] + 1)
+        elif key == 'ArrowLeft' and not s["view_stack"]: self.switch_tab(s["tab_index"] - 1)
+        elif key == 'ArrowDown':
+            s["row_index"] += 1
+            self._clamp_row()
+        elif key == 'ArrowUp':
+            s["row_index"] -= 1
+            self._clamp_row()
+        elif key == 'Enter': self.handle_enter()
+        elif key == 'Escape': self.go_back()
+        elif key == 'F10': self.toggle_save_dialog(True)
+
+    # --- SKRIPTE ---
+
+    def run(self, keys, export=False):
+        """Spielt eine Tastenfolge ab (ab Startzustand) und liefert das Ergebnis."""
+        self.reset()
+        for key in keys:
+            self.press(key)
+        result = {"state": self.snapshot(), "changes": dict(self.changes), "saves": self.saves}
+        if export:
+            result["export"] = self.export()
+        return result
+
+    def snapshot(self):
+        row = self.current_row()
+        return {
+            "tab_index": self.state["tab_index"],
+            "view": self.view_paths.get(self.state["current_view"]),
+            "view_depth": len(self.state["view_stack"]),
+            "row_index": self.state["row_index"],
+            "row_label": row["label"] if row else None,
+            "modal_open": self.state["modal_open"],
+            "save_open": self.state["save_open"]
+        }
+
+    def export(self):
+        """Entspricht dem JSON-Download bei Save & Exit."""
+        return copy.deepcopy(self.data)
+
+    # --- VALIDIERUNG ---
+
+    def reachable_paths(self, conditions=True):
+        """
+        Tastenfolge zu jeder im Startzustand erreichbaren Zeile (Item-ID -> Keys).
+        Mit conditions=False zählt nur die Menüstruktur (SuppressIf/GrayOutIf ignoriert).
+        """
+        self.reset()
+        paths = {}
+        for tab_index, view_id in enumerate(self.tab_views):
+            self._walk(view_id, ['ArrowRight'] * tab_index, paths, set(), conditions)
+        return paths
+
+    def _walk(self, view_id, prefix, paths, visiting, conditions):
+        if view_id in visiting:
+            return
+        visiting = visiting | {view_id}
+        rows = self.visible_rows(view_id) if conditions else self.views.get(view_id, [])
+        for index, row in enumerate(rows):
+            keys = prefix + ['ArrowDown'] * index
+            paths.setdefault(row["id"], keys)
+            if row["type"] == "submenu" and not (conditions and row["cond"] in self.grayed):
+                self._walk(row["target"], keys + ['Enter'], paths, visiting, conditions)
+
+    def item_path(self, item_id):
+        """
+        Keys (ab Tab 0, Zeile 0) zum ersten bedienbaren Vorkommen des Items im
+        aktuellen Zustand, oder None. Läuft nur die Kette der Submenüs hoch,
+        statt den ganzen Baum abzugehen.
+        """
+        for row in self.occurrences.get(item_id, ()):
+            if row["cond"] in self.grayed:
+                continue
+            segments = []
+            node = row
+            while node is not None:
+                index = self._row_index(node["view"], node)
+                if index is None or (node is not row and node["cond"] in self.grayed):
+                    break
+                segments.append(['ArrowDown'] * index)
+                node = node["parent"]
+            else:
+                keys = ['ArrowRight'] * self.view_tabs[row["view"]]
+                for segment in reversed(segments[1:]):
+                    keys += segment + ['Enter']
+                return keys + segments[0]
+        return None
+
+    def coverage_scripts(self):
+        """
+        Ein Skript pro (Item, Option): hinnavigieren, Option wählen, speichern.
+        Versteckte/ausgegraute Items werden vorher über ihre steuernden Fragen freigeschaltet;
+        Items mit denselben steuernden Werten teilen sich ein Setup.
+        Rückgabe: (Liste von (item_id, option, keys), Item-IDs die sich nicht freischalten lassen)
+        """
+        scripts = []
+        never_enabled = []
+        groups = {}            # Setup (Slot/Option-Paare) -> Item-IDs
+        for item_id in self.reachable_paths(conditions=False):
+            item = self.id_map[item_id]
+            if item.get("type") != "select" or not item.get("options"):
+                continue
+            if self.item_path(item_id) is not None:
+                groups.setdefault((), []).append(item_id)
+                continue
+            assignment = self._find_assignment(item_id)
+            if assignment is None:
+                never_enabled.append(item_id)
+            else:
+                groups.setdefault(tuple(sorted(assignment.items())), []).append(item_id)
+
+        for assignment, item_ids in groups.items():
+            setup = self.enabling_keys(dict(assignment))
+            for item_id in item_ids:
+                path = self.item_path(item_id) if setup is not None else None
+                if path is None:
+                    never_enabled.append(item_id)
+                    continue
+                options = self.id_map[item_id]["options"]
+                current = self.display.get(item_id, self.id_map[item_id].get("value"))
+                start = options.index(current) if current in options else 0
+                for target, option in enumerate(options):
+                    delta = target - start
+                    moves = ['ArrowDown'] * delta if delta > 0 else ['ArrowUp'] * -delta
+                    scripts.append((item_id, option,
+                                    setup + path + ['Enter'] + moves + ['Enter', 'F10', 'y', 'Enter']))
+        self.reset()
+        return scripts, never_enabled
+
+    def enabling_keys(self, assignment):
+        """
+        Setzt die Fragen aus assignment (Slot -> Option) ab Startzustand über die Tastatur.
+        Rückgabe: Setup-Keys (endet auf Tab 0, Zeile 0) oder None, wenn eine Frage
+        nicht bedienbar wird. Die Engine bleibt im Zustand nach dem Setup.
+        """
+        self.reset()
+        setup = []
+        pending = dict(assignment)
+        while pending:
+            progress = False
+            for slot in list(pending):
+                item_id = self.conditions["q"][slot]
+                path = self.item_path(item_id)
+                if path is None:
+                    continue
+                option = pending.pop(slot)
+                setup += self._select_keys(item_id, option, path)
+                # Ergebnis der Keys direkt übernehmen statt jede Taste abzuspielen;
+                # die Skripte selbst laufen später vollständig durch run()
+                self._set_value(item_id, option)
+                progress = True
+            if not progress:
+                return None
+        return setup
+
+    def _find_assignment(self, item_id):
+        """
+        Sucht Werte (Slot -> Option), für die kein Suppress/GrayOut des Items oder seiner
+        Menüs greift. Wertet nur die betroffenen Bedingungen aus (Startzustand vorausgesetzt).
+        """
+        c = self.conditions
+        if not c:
+            return None
+        conds = []
+        node = self.occurrences[item_id][0]
+        while node is not None:
+            if node["cond"] is not None:
+                conds.extend(c["t"][node["cond"]][1::2])
+            node = node["parent"]
+
+        slots = sorted({slot for ci in conds for slot in self.cond_slot_lists[ci]})
+        # Nur Fragen, die in der Config stehen, lassen sich per Tastatur setzen
+        candidates = [
+            [None] + (list(c["m"][slot]) if c["q"][slot] in self.id_map else [])
+            for slot in slots
+        ]
+
+        values = self.cond_values
+        saved = [values[slot] for slot in slots]
+        found = None
+        for combo in itertools.islice(itertools.product(*candidates), 4096):
+            for slot, label, old in zip(slots, combo, saved):
+                values[slot] = old if label is None else self._cond_value_of(slot, label)
+            if not any(self._eval_condition(ci) for ci in conds):
+                found = {slot: label for slot, label in zip(slots, combo) if label is not None}
+                break
+        for slot, old in zip(slots, saved):
+            values[slot] = old
+        return found
+
+    def _select_keys(self, item_id, option, path):
+        """Keys: Option eines Items wählen und zurück auf Tab 0, Zeile 0."""
+        options = self.id_map[item_id].get("options") or []
+        current = self.display.get(item_id, self.id_map[item_id].get("value"))
+        delta = options.index(option) - (options.index(current) if current in options else 0)
+        moves = ['ArrowDown'] * delta if delta > 0 else ['ArrowUp'] * -delta
+        tab_index = path.count('ArrowRight')
+        home = ['Escape'] * path.count('Enter') + ['ArrowRight'] * (len(self.tab_views) - tab_index)
+        return path + ['Enter'] + moves + ['Enter'] + home
+
+
+# --- PARALLELE AUSFÜHRUNG ---
+
+_WORKER_ENGINE = None
+
+def _init_worker(config):
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = BiosEngine(config)
+
+def _run_worker(keys):
+    return _WORKER_ENGINE.run(keys)
+
+def run_scripts(config, scripts, processes=None):
+    """Führt viele Skripte parallel aus (eine Engine pro Prozess)."""
+    if processes == 1:
+        engine = BiosEngine(config)
+        return [engine.run(keys) for keys in scripts]
+
+    workers = processes or os.cpu_count() or 1
+    chunksize = max(1, len(scripts) // (workers * 8))
+    with Pool(workers, initializer=_init_worker, initargs=(config,)) as pool:
+        return pool.map(_run_worker, scripts, chunksize=chunksize)
+
+def check_config(config, processes=None):
+    """Erreichbarkeit aller Items + Round-Trip jeder Option."""
+    engine = BiosEngine(config)
+    structural = engine.reachable_paths(conditions=False)
+    reachable = engine.reachable_paths()
+    unreachable = [item_id for item_id in engine.id_map if item_id not in structural]
+    # Per SuppressIf/GrayOutIf im Startzustand nicht erreichbar (kein Fehler)
+    hidden = [item_id for item_id in structural if item_id not in reachable]
+
+    failures = []
+    # Items mit Optionen, die im Browser kein Options-Popup öffnen (nur type "select")
+    for item_id, item in engine.id_map.items():
+        if item.get("options") and item.get("type") != "select":
+            failures.append({"id": item_id, "label": item.get("label"), "reason": "not_editable"})
+
+    scripts, never_enabled = engine.coverage_scripts()
+    results = run_scripts(config, [keys for _, _, keys in scripts], processes)
+
+    for (item_id, option, _), result in zip(scripts, results):
+        saved = result["saves"][-1] if result["saves"] else {}
+        if saved.get(item_id, engine.id_map[item_id].get("value")) != option:
+            failures.append({"id": item_id, "label": engine.id_map[item_id].get("label"),
+                             "option": option, "reason": "round_trip"})
+
+    return {
+        "items": len(engine.id_map),
+        "unreachable": unreachable,
+        "hidden_at_start": hidden,
+        # Bedingung lässt sich über keine Kombination der steuernden Fragen aufheben
+        "never_enabled": never_enabled,
+        "round_trips": len(scripts),
+        "failures": failures
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless BIOS Simulation")
+    parser.add_argument("config_file", help="Datei im config/input Ordner")
+    parser.add_argument("scripts", nargs="?",
+                        help="JSON: Liste von Tasten oder Liste von Tastenfolgen")
+    parser.add_argument("--check", action="store_true",
+                        help="Erreichbarkeit + Round-Trip aller Optionen prüfen")
+    parser.add_argument("--jobs", type=int, default=None, help="Anzahl Prozesse (Standard: alle CPUs)")
+    parser.add_argument("--export", help="Exportiertes JSON (nur bei einem Skript) speichern")
+    args = parser.parse_args()
+
+    _, config_path, _ = get_paths(args.config_file)
+    if not os.path.exists(config_path):
+        print(f"❌ FEHLER: Datei nicht gefunden: {config_path}")
+        sys.exit(1)
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    if args.check:
+        report = check_config(config, args.jobs)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        sys.exit(1 if report["failures"] or report["unreachable"] else 0)
+
+    if not args.scripts:
+        parser.error("Skript-Datei oder --check angeben")
+    with open(args.scripts, 'r', encoding='utf-8') as f:
+        scripts = json.load(f)
+
+    if scripts and isinstance(scripts[0], str):
+        result = BiosEngine(config).run(scripts, export=bool(args.export))
+        if args.export:
+            with open(args.export, 'w', encoding='utf-8') as f:
+                json.dump(result.pop("export"), f, indent=2)
+            print(f"✅ Export gespeichert in: {args.export}")
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        results = run_scripts(config, scripts, args.jobs)
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
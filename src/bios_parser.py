@@ -2,6 +2,9 @@ import re
 import json
 import os
 import html
+import hashlib
+
+from ifr_conditions import ConditionTracker, compile_conditions
 
 # --- PFAD KONFIGURATION ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +24,7 @@ class IfrDumpParser:
         self.forms = {}
         self.current_form_id = None
         self.referenced_forms = set()
+        self.conditions = ConditionTracker()
         self._compile_regex()
 
     def _compile_regex(self):
@@ -44,6 +48,15 @@ class IfrDumpParser:
         # CheckBox: "CheckBox: Label , Variable: 0x12"
         self.re_checkbox = re.compile(r"CheckBox:\s+([^,]+)\s*,.*Variable:\s+(0x[\da-fA-F]+)")
         
+        # QuestionId: Schlüssel für SuppressIf/GrayOutIf Ausdrücke
+        self.re_question_id = re.compile(r"QuestionId:\s*(0x[\da-fA-F]+)")
+
+        # Defaults: Flag an der Option ("..., Value: 0x1, Default") oder eigener
+        # Default-Opcode nach den Optionen ("Default: DefaultId: 0x0, Value: 0x1").
+        # \bDefault trifft nicht "MfgDefault" (Fertigungs-Default)
+        self.re_default_flag = re.compile(r"\bDefault\b(?!\s*:)")
+        self.re_default = re.compile(r"^(?:0x[\da-fA-F]+\s+)?Default\b(?:.*?DefaultId:\s*(0x[\da-fA-F]+))?.*?Value:\s*(0x[\da-fA-F]+)")
+
         # Text
         self.re_text = re.compile(r"(?:Subtitle:\s+Statement.Prompt:|Text:)\s+([^,\r\n]+)(?:,|$)")
 
@@ -69,13 +82,17 @@ class IfrDumpParser:
         # Nur weitermachen, wenn wir in einer Form sind
         if not self.current_form_id: return
 
+        if self.conditions.process(line): return
         if self._handle_ref(line): return
         if self._handle_oneof(line): return
         if self._handle_checkbox(line): return
         if self._handle_option(line): return
+        if self._handle_default(line): return
         if self._handle_text(line): return
 
     def _handle_form(self, line):
+        # Substring-Check vorab: spart die Regex bei den meisten Zeilen
+        if "Form:" not in line: return False
         m = self.re_form.search(line)
         if m:
             _, title, form_id = m.groups()
@@ -85,10 +102,12 @@ class IfrDumpParser:
                 "title": title.strip(),
                 "items": []
             }
+            self.conditions.reset()
             return True
         return False
 
     def _handle_ref(self, line):
+        if "Ref:" not in line: return False
         m = self.re_ref.search(line)
         if m:
             label, target_id = m.groups()
@@ -102,6 +121,7 @@ class IfrDumpParser:
         return False
 
     def _handle_oneof(self, line):
+        if "OneOf:" not in line: return False
         m = self.re_oneof.search(line)
         if m:
             label, var_id = m.groups()
@@ -110,12 +130,14 @@ class IfrDumpParser:
                 "label": label.strip(),
                 "id": var_id,
                 "value": "Select...", 
-                "options": []
-            })
+                "options": [],
+                "option_values": []
+            }, line)
             return True
         return False
 
     def _handle_checkbox(self, line):
+        if "CheckBox:" not in line: return False
         m = self.re_checkbox.search(line)
         if m:
             label, var_id = m.groups()
@@ -124,8 +146,10 @@ class IfrDumpParser:
                 "label": label.strip(),
                 "id": var_id,
                 "value": "Disabled",
-                "options": ["Disabled", "Enabled"]
-            })
+                "options": ["Disabled", "Enabled"],
+                "option_values": ["0x0", "0x1"],
+                "default": "Enabled" if self.re_default_flag.search(line) else "Disabled"
+            }, line)
             return True
         return False
 
@@ -138,15 +162,32 @@ class IfrDumpParser:
         if m:
             last = items[-1]
             if last["type"] == "select":
-                opt_lbl, _ = m.groups()
+                opt_lbl, opt_val = m.groups()
                 clean_lbl = opt_lbl.strip()
                 last["options"].append(clean_lbl)
+                last.setdefault("option_values", []).append(opt_val)
+                if self.re_default_flag.search(line[m.end():]):
+                    last["default"] = clean_lbl
                 # Default Value setzen
                 if last["value"] == "Select...":
                     last["value"] = clean_lbl
             return True
         return False
 
+    def _handle_default(self, line):
+        # Standard-Default (DefaultId 0x0) der letzten Frage, Wert -> Options-Label
+        if "Default" not in line: return False
+        m = self.re_default.match(line)
+        if not m: return False
+        items = self.forms[self.current_form_id]["items"]
+        if items and items[-1]["type"] == "select" and int(m.group(1) or "0x0", 16) == 0:
+            last = items[-1]
+            values = [int(v, 16) for v in last.get("option_values", [])]
+            value = int(m.group(2), 16)
+            if value in values:
+                last["default"] = last["options"][values.index(value)]
+        return True
+
     def _handle_text(self, line):
         m = self.re_text.search(line)
         if m:
@@ -156,7 +197,14 @@ class IfrDumpParser:
             return True
         return False
 
-    def _add_item(self, item):
+    def _add_item(self, item, line=None):
+        if line is not None:
+            m = self.re_question_id.search(line)
+            if m:
+                item["question_id"] = m.group(1)
+        conditions = self.conditions.active()
+        if conditions:
+            item["conditions"] = conditions
         self.forms[self.current_form_id]["items"].append(item)
 
     def _build_hierarchy(self):
@@ -191,11 +239,15 @@ def generate_html(all_forms, root_tabs):
         rows_html = ""
         for item in form["items"]:
             lbl = html.escape(item["label"])
+            # IDs für Ziele von SuppressIf/GrayOutIf (vom Compiler vergeben)
+            id_attr = f' data-id="{item["id"]}"' if "id" in item else ""
+            if "_cond" in item:
+                id_attr += f' data-cond="{item["_cond"]}"'
             
             if item["type"] == "submenu":
                 target = item["target"]
                 rows_html += f'''
-                <div class="menu-row" data-type="submenu" data-target="view_{target}" data-help="Enter Submenu">
+                <div class="menu-row" data-type="submenu" data-target="view_{target}"{id_attr} data-help="Enter Submenu">
                     <span class="item-label">{lbl}</span>
                     <span class="item-value">►</span>
                 </div>'''
@@ -203,16 +255,15 @@ def generate_html(all_forms, root_tabs):
             elif item["type"] == "select":
                 val = html.escape(item["value"])
                 opts = json.dumps(item["options"]).replace('"', '&quot;')
-                item_id = item["id"]
                 rows_html += f'''
-                <div class="menu-row" data-type="select" data-id="{item_id}" data-options="{opts}" data-help="Change Option">
+                <div class="menu-row" data-type="select"{id_attr} data-options="{opts}" data-help="Change Option">
                     <span class="item-label">{lbl}</span>
                     <span class="item-value" style="color:var(--text-color);">{val}</span>
                 </div>'''
                 
             elif item["type"] == "text":
                 rows_html += f'''
-                <div class="menu-row" style="color: yellow; pointer-events:none;">
+                <div class="menu-row"{id_attr} style="color: yellow; pointer-events:none;">
                     <span class="item-label">{lbl}</span>
                     <span class="item-value"></span>
                 </div>'''
@@ -246,6 +297,9 @@ def main():
         return
 
     print(f"Hierarchie: {len(root_tabs)} Tabs, {len(all_forms)} Forms.")
+
+    # Bedingungen vor dem Rendern kompilieren (vergibt fehlende Item-IDs)
+    conditions = compile_conditions(all_forms.values())
     
     nav_html, views_html = generate_html(all_forms, root_tabs)
     
@@ -263,12 +317,18 @@ def main():
     with open(TEMPLATE_FILE, "r", encoding="utf-8") as f:
         template = f.read()
 
+    json_data = json.dumps(js_data)
+    config_hash = hashlib.sha1(json_data.encode("utf-8")).hexdigest()[:16]
+
     final_html = template.replace("{TITLE}", "BIOS SETUP UTILITY") \
                          .replace("{NAV_TABS}", nav_html) \
                          .replace("{TAB_CONTENT}", views_html) \
                          .replace("{FOOTER}", "v02.61 American Megatrends - F10: Save  ESC: Back") \
                          .replace("{THEME_CSS}", "") \
-                         .replace("{JSON_DATA}", json.dumps(js_data))
+                         .replace("{CONFIG_HASH}", config_hash) \
+                         .replace("{MANIFEST}", "null") \
+                         .replace("{CONDITIONS}", json.dumps(conditions, separators=(",", ":"))) \
+                         .replace("{JSON_DATA}", json_data)
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         f.write(final_html)
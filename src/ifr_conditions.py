@@ -0,0 +1,308 @@
+import re
+import json
+
+# --- OPCODES DES KOMPILIERTEN PROGRAMMS ---
+# Das Programm ist eine flache Integer-Liste in Postfix-Reihenfolge:
+#   OP_EQ   slot wert
+#   OP_IN   slot anzahl wert1 wert2 ...
+#   OP_AND / OP_OR / OP_NOT / OP_TRUE / OP_FALSE
+OP_EQ = 0
+OP_IN = 1
+OP_AND = 2
+OP_OR = 3
+OP_NOT = 4
+OP_TRUE = 5
+OP_FALSE = 6
+
+# DisableIf: In EDK2-Browsern wird das Statement dann gar nicht angezeigt,
+# es verhält sich also wie SuppressIf (nicht wie GrayOutIf)
+KIND_CODES = {"suppress": 0, "grayout": 1, "disable": 0}
+
+
+class ConditionTracker:
+    """
+    Sammelt SuppressIf/GrayOutIf/DisableIf Bedingungen während des Parsens.
+    IFR Ausdrücke stehen im Dump bereits in Postfix-Reihenfolge,
+    daher reicht ein Stack, um daraus einen Baum zu bauen.
+    """
+    def __init__(self):
+        self.scopes = []
+        self._active = []  # Wird nur bei Änderungen neu gebaut, Items teilen sich die Liste
+        self._compile_regex()
+
+    def _compile_regex(self):
+        # Adresse vorne ("0x1A3F4") und Rohbytes hinten ("{0A 82}") abschneiden
+        self.re_address = re.compile(r"^0x[\da-fA-F]+\s+")
+        self.re_bytes = re.compile(r"\s*\{[\da-fA-F\s]*\}$")
+
+        self.re_open = re.compile(r"^(Suppress\s*If|Gray\s*Out\s*If|Disable\s*If)\b", re.IGNORECASE)
+        self.re_close = re.compile(r"^End\s*If\b", re.IGNORECASE)
+
+        # EqIdVal: "EqIdVal QuestionId: 0x5, Value: 0x1" oder "Variable 0x5 equals 0x1"
+        self.re_eq_val = re.compile(r"^EqIdVal\b.*?QuestionId:\s*(0x[\da-fA-F]+).*?Value:\s*(0x[\da-fA-F]+)")
+        self.re_eq_val_short = re.compile(r"^Variable\s+(0x[\da-fA-F]+)\s+equals\s+(0x[\da-fA-F]+)$")
+
+        # EqIdList: "EqIdValList QuestionId: 0x5, ... List: 0x1, 0x2" oder
+        #           "Variable 0x5 equals value in list (0x1, 0x2)"
+        self.re_eq_list = re.compile(r"^EqId(?:Val)?List\b.*?QuestionId:\s*(0x[\da-fA-F]+).*?(?:List|Values):\s*(.+)$")
+        self.re_eq_list_short = re.compile(r"^Variable\s+(0x[\da-fA-F]+)\s+equals\s+value\s+in\s+list\s*\((.+)\)$")
+        self.re_hex = re.compile(r"0x[\da-fA-F]+")
+
+        self.re_logic = re.compile(r"^(And|Or|Not|True|False)$", re.IGNORECASE)
+
+        # Andere Ausdrucks-Opcodes: Wir werten sie nicht aus, erkennen sie aber,
+        # damit der Ausdruck nicht vorzeitig endet.
+        self.re_other = re.compile(
+            r"^(?:Variable\s+0x[\da-fA-F]+\s+equals\s+variable|EqIdId|Question\s*Ref|Rule\s*Ref|"
+            r"Uint(?:8|16|32|64)\b|Equal\b|Not\s*Equal|Greater\s*(?:Than|Equal)|Less\s*(?:Than|Equal)|"
+            r"Bitwise|Add$|Subtract$|Multiply$|Divide$|Modulo$|Length$|Match$|Catenate$|"
+            r"Conditional$|Dup$|This$|Zero$|One$|Ones$|Undefined$|Version$|To\s*(?:Boolean|String|Int|Upper|Lower)$)",
+            re.IGNORECASE
+        )
+
+    def reset(self):
+        """Neue Form: offene Bedingungen gelten nicht weiter."""
+        self.scopes = []
+        self._active = []
+
+    def process(self, line):
+        """Verarbeitet eine Zeile. True, wenn sie zu einer Bedingung gehörte."""
+        # Schneller Ausstieg: Solange kein Ausdruck gesammelt wird,
+        # sind nur "... If" / "End If" Zeilen interessant
+        collecting = self.scopes and self.scopes[-1]["expr"] is None
+        if not collecting and "if" not in line.lower():
+            return False
+
+        body = self.re_bytes.sub("", self.re_address.sub("", line.strip()))
+
+        if self._handle_open(body): return True
+        if self._handle_close(body): return True
+
+        if not self.scopes or self.scopes[-1]["expr"] is not None:
+            return False
+
+        token = self._parse_token(body)
+        if token is not None:
+            self.scopes[-1]["tokens"].append(token)
+            return True
+
+        # Erstes Statement nach dem Ausdruck -> Ausdruck abschließen
+        self._finish_expression()
+        return False
+
+    def active(self):
+        """Liefert alle Bedingungen, die für das nächste Item gelten."""
+        return self._active
+
+    # --- HANDLER METHODEN ---
+
+    def _handle_open(self, body):
+        m = self.re_open.match(body)
+        if m:
+            if self.scopes and self.scopes[-1]["expr"] is None:
+                self._finish_expression()
+            # "Gray Out If" -> "grayout"
+            kind = re.sub(r"\s+", "", m.group(1)).lower()[:-2]
+            self.scopes.append({"kind": kind, "tokens": [], "expr": None})
+            return True
+        return False
+
+    def _handle_close(self, body):
+        if self.re_close.match(body):
+            if self.scopes and self.scopes.pop()["expr"] is not None:
+                self._active = self._active[:-1]
+            return True
+        return False
+
+    def _parse_token(self, body):
+        m = self.re_eq_val.match(body) or self.re_eq_val_short.match(body)
+        if m:
+            return {"op": "eq", "qid": m.group(1), "value": m.group(2)}
+
+        m = self.re_eq_list.match(body) or self.re_eq_list_short.match(body)
+        if m:
+            return {"op": "in", "qid": m.group(1), "values": self.re_hex.findall(m.group(2))}
+
+        m = self.re_logic.match(body)
+        if m:
+            return {"op": m.group(1).lower()}
+
+        if self.re_other.match(body):
+            return {"op": "unknown"}
+        return None
+
+    def _finish_expression(self):
+        scope = self.scopes[-1]
+        scope["expr"] = build_tree(scope["tokens"])
+        del scope["tokens"]
+        self._active = self._active + [{"kind": scope["kind"], "expr": scope["expr"]}]
+
+
+def build_tree(tokens):
+    """Baut aus Postfix-Tokens einen Ausdrucksbaum. Unbekanntes -> 'unknown'."""
+    stack = []
+    for token in tokens:
+        op = token["op"]
+        if op == "unknown":
+            return {"op": "unknown"}
+        if op == "not":
+            if not stack:
+                return {"op": "unknown"}
+            stack.append({"op": "not", "args": [stack.pop()]})
+        elif op in ("and", "or"):
+            if len(stack) < 2:
+                return {"op": "unknown"}
+            right = stack.pop()
+            stack.append({"op": op, "args": [stack.pop(), right]})
+        else:
+            stack.append(token)
+
+    if len(stack) != 1:
+        return {"op": "unknown"}
+    return stack[0]
+
+
+# --- COMPILER (Generator-Seite) ---
+
+class ConditionCompiler:
+    """
+    Übersetzt die Bedingungs-Bäume aller Items in ein kompaktes Postfix-Programm
+    plus Reverse-Index (Question -> Bedingungen -> Items) für die Runtime.
+    """
+    def __init__(self):
+        self.questions = {}    # question_id -> Item
+        self.variables = {}    # id -> Item (Fallback für Variable-IDs)
+        self.conditioned = []  # (Item, Index-Pfad)
+        self.item_paths = {}   # id(Item) -> Index-Pfad, für IDs fehlender Questions
+
+        self.slots = {}        # qid -> Slot-Index
+        self.slot_ids = []
+        self.slot_maps = []
+        self.slot_values = []
+
+        self.program = []
+        self.cond_index = {}   # kanonischer Ausdruck -> Bedingungs-Index
+        self.cond_ranges = []
+        self.cond_slots = []
+
+    def compile(self, tabs):
+        for index, tab in enumerate(tabs):
+            # Forms aus dem Dump haben eine ID, Tabs aus der Config nur ihre Position
+            self._collect(tab.get("items", []), str(tab.get("id", index)))
+        if not self.conditioned:
+            return None
+
+        # Ein Target pro Vorkommen: Dieselbe Variable kann in mehreren Forms
+        # mit unterschiedlichen Bedingungen stehen. Die Zeile bekommt den
+        # Target-Index über "_cond" (Renderer -> data-cond).
+        target_list = []
+        for item, item_path in self.conditioned:
+            if "id" not in item:
+                # Stabil über Builds (Autosave-Schlüssel), gleiches Schema wie main.py
+                item["id"] = f"item-{item_path}"
+            item["_cond"] = len(target_list)
+            entry = [item["id"]]
+            for cond in item["conditions"]:
+                ci = self._compile_condition(cond["expr"])
+                entry.extend([ci, KIND_CODES.get(cond["kind"], 0)])
+            target_list.append(entry)
+
+        cond_targets = [[] for _ in self.cond_ranges]
+        for ti, entry in enumerate(target_list):
+            for ci in entry[1::2]:
+                if not cond_targets[ci] or cond_targets[ci][-1] != ti:
+                    cond_targets[ci].append(ti)
+
+        slot_conds = [[] for _ in self.slot_ids]
+        for ci, slots in enumerate(self.cond_slots):
+            for slot in slots:
+                slot_conds[slot].append(ci)
+
+        return {
+            "q": self.slot_ids,
+            "m": self.slot_maps,
+            "v": self.slot_values,
+            "p": self.program,
+            "c": self.cond_ranges,
+            "t": target_list,
+            "x": cond_targets,
+            "d": slot_conds
+        }
+
+    def _collect(self, items, path):
+        for position, item in enumerate(items):
+            item_path = f"{path}-{position}"
+            if "question_id" in item:
+                self.questions.setdefault(item["question_id"], item)
+                self.item_paths[id(item)] = item_path
+            if "id" in item:
+                self.variables.setdefault(item["id"], item)
+            if item.get("conditions"):
+                self.conditioned.append((item, item_path))
+            if item.get("items"):
+                self._collect(item["items"], item_path)
+
+    def _compile_condition(self, expr):
+        key = json.dumps(expr, sort_keys=True)
+        if key in self.cond_index:
+            return self.cond_index[key]
+
+        start = len(self.program)
+        used_slots = set()
+        self._emit(expr, used_slots)
+        ci = len(self.cond_ranges)
+        self.cond_index[key] = ci
+        self.cond_ranges.append([start, len(self.program)])
+        self.cond_slots.append(sorted(used_slots))
+        return ci
+
+    def _emit(self, node, used_slots):
+        op = node["op"]
+        if op == "eq":
+            slot = self._slot(node["qid"])
+            used_slots.add(slot)
+            self.program.extend([OP_EQ, slot, int(node["value"], 16)])
+        elif op == "in":
+            slot = self._slot(node["qid"])
+            used_slots.add(slot)
+            values = [int(v, 16) for v in node["values"]]
+            self.program.extend([OP_IN, slot, len(values)] + values)
+        elif op in ("and", "or"):
+            for arg in node["args"]:
+                self._emit(arg, used_slots)
+            self.program.append(OP_AND if op == "and" else OP_OR)
+        elif op == "not":
+            self._emit(node["args"][0], used_slots)
+            self.program.append(OP_NOT)
+        elif op == "true":
+            self.program.append(OP_TRUE)
+        else:
+            # "false" und nicht auswertbare Ausdrücke: Item bleibt sichtbar
+            self.program.append(OP_FALSE)
+
+    def _slot(self, qid):
+        if qid in self.slots:
+            return self.slots[qid]
+
+        item = self.questions.get(qid) or self.variables.get(qid)
+        if item is not None and "id" not in item:
+            # Die Runtime findet den Slot über die Item-ID -> jetzt vergeben,
+            # gleiches Schema wie main.py/BiosEngine
+            item["id"] = f"item-{self.item_paths[id(item)]}"
+        value_map = {}
+        if item is not None:
+            for label, value in zip(item.get("options", []), item.get("option_values", [])):
+                if value is not None:
+                    value_map.setdefault(label, int(value, 16))
+
+        slot = len(self.slot_ids)
+        self.slots[qid] = slot
+        self.slot_ids.append(item.get("id") if item is not None else None)
+        self.slot_maps.append(value_map)
+        self.slot_values.append(value_map.get(item.get("value")) if item is not None else None)
+        return slot
+
+
+def compile_conditions(tabs):
+    """Kompiliert alle Bedingungen einer Config. None, wenn es keine gibt."""
+    return ConditionCompiler().compile(tabs)
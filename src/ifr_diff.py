@@ -0,0 +1,293 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from bios_parser import IfrDumpParser
+
+# --- PFADE KONFIGURATION ---
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_DIR = os.path.join(BASE_DIR, 'data', '03_ifr_dumps')
+
+
+class IfrDumpDiff:
+    """
+    Struktureller Vergleich zweier IFR Dumps (z.B. alte vs. neue BIOS Version).
+    Jede Form bekommt einen Hash über ihren kompletten Unterbaum (Merkle-Prinzip),
+    unveränderte Forms werden dadurch ohne Item-Vergleich übersprungen.
+    Fragen werden über Form-Pfad + Variable-ID zugeordnet, nicht über die Position.
+    """
+    def __init__(self, old_forms, old_tabs, new_forms, new_tabs):
+        self.old = _FormIndex(old_forms)
+        self.new = _FormIndex(new_forms)
+        self.old_tabs = old_tabs
+        self.new_tabs = new_tabs
+        self.report = {"added": [], "removed": [], "changed": []}
+        self.forms_skipped = 0
+
+    def run(self):
+        self._diff_children(
+            "",
+            [(tab["title"], tab["id"]) for tab in self.old_tabs],
+            [(tab["title"], tab["id"]) for tab in self.new_tabs],
+            set()
+        )
+        self.report["summary"] = {
+            "added": len(self.report["added"]),
+            "removed": len(self.report["removed"]),
+            "changed": len(self.report["changed"]),
+            "forms_skipped": self.forms_skipped
+        }
+        return self.report
+
+    # --- VERGLEICH ---
+
+    def _diff_children(self, path, old_refs, new_refs, visiting):
+        """Vergleicht Unter-Forms, zugeordnet über ihren Titel."""
+        old_by_label = _keyed(old_refs, lambda ref: ref[0])
+        new_by_label = _keyed(new_refs, lambda ref: ref[0])
+
+        for key, (label, old_fid) in old_by_label.items():
+            child_path = f"{path} > {label}" if path else label
+            if key not in new_by_label:
+                self._report_subtree("removed", self.old, child_path, old_fid, set())
+                continue
+            self._diff_form(child_path, old_fid, new_by_label[key][1], visiting)
+
+        for key, (label, new_fid) in new_by_label.items():
+            if key not in old_by_label:
+                child_path = f"{path} > {label}" if path else label
+                self._report_subtree("added", self.new, child_path, new_fid, set())
+
+    def _diff_form(self, path, old_fid, new_fid, visiting):
+        old_hash = self.old.subtree_hash(old_fid)
+        if old_hash is not None and old_hash == self.new.subtree_hash(new_fid):
+            # Ganzer Unterbaum gleich: alle enthaltenen Forms zählen als übersprungen
+            self.forms_skipped += self.old.sizes[old_fid]
+            return
+        if (old_fid, new_fid) in visiting:
+            return
+        visiting = visiting | {(old_fid, new_fid)}
+
+        old_items = self.old.forms.get(old_fid, {}).get("items", [])
+        new_items = self.new.forms.get(new_fid, {}).get("items", [])
+
+        old_questions = _keyed(_questions(old_items), lambda item: item["id"])
+        new_questions = _keyed(_questions(new_items), lambda item: item["id"])
+
+        for key, old_item in old_questions.items():
+            new_item = new_questions.get(key)
+            if new_item is None:
+                self.report["removed"].append(_question_entry(path, old_item))
+                continue
+            changes = _compare_questions(old_item, new_item, self.old, self.new)
+            if changes:
+                entry = _question_entry(path, new_item)
+                entry["changes"] = changes
+                self.report["changed"].append(entry)
+
+        for key, new_item in new_questions.items():
+            if key not in old_questions:
+                self.report["added"].append(_question_entry(path, new_item))
+
+        self._diff_children(path, _refs(old_items), _refs(new_items), visiting)
+
+    def _report_subtree(self, kind, index, path, fid, visiting):
+        """Alle Fragen einer nur auf einer Seite vorhandenen Form melden."""
+        if fid in visiting:
+            return
+        visiting.add(fid)
+        items = index.forms.get(fid, {}).get("items", [])
+        for item in _questions(items):
+            self.report[kind].append(_question_entry(path, item))
+        for label, child_fid in _refs(items):
+            self._report_subtree(kind, index, f"{path} > {label}", child_fid, visiting)
+
+
+class _FormIndex:
+    """Berechnet (memoisiert) den Hash jedes Form-Unterbaums."""
+    def __init__(self, forms):
+        self.forms = forms
+        self.hashes = {}
+        self.sizes = {}        # Anzahl Forms im Unterbaum (für forms_skipped)
+        self._in_progress = set()
+        self._conditions = {}  # id(Bedingungsliste) -> lesbare Form (Items teilen sich Listen)
+
+        # Question-IDs werden pro Build neu vergeben -> in Bedingungen auf Variable-IDs abbilden
+        self.qid_vars = {}
+        for form in forms.values():
+            for item in form["items"]:
+                if "question_id" in item:
+                    self.qid_vars.setdefault(item["question_id"], item.get("id"))
+
+    def conditions(self, item):
+        """Bedingungen des Items als Text, Question-IDs durch Variable-IDs ersetzt."""
+        conds = item.get("conditions")
+        if not conds:
+            return None
+        key = id(conds)
+        if key not in self._conditions:
+            self._conditions[key] = " ; ".join(
+                f"{cond['kind']}: {self._format_expr(cond['expr'])}" for cond in conds
+            )
+        return self._conditions[key]
+
+    def _format_expr(self, node):
+        op = node["op"]
+        if op in ("eq", "in"):
+            var = self.qid_vars.get(node["qid"]) or f"?{node['qid']}"
+            if op == "eq":
+                return f"{var} == {node['value']}"
+            return f"{var} in [{', '.join(node['values'])}]"
+        if op in ("and", "or"):
+            return "(" + f" {op} ".join(self._format_expr(arg) for arg in node["args"]) + ")"
+        if op == "not":
+            return f"not ({self._format_expr(node['args'][0])})"
+        return op
+
+    def subtree_hash(self, fid):
+        if fid in self.hashes:
+            return self.hashes[fid]
+        form = self.forms.get(fid)
+        if form is None:
+            return None
+        if fid in self._in_progress:
+            # Zyklische Referenz: nur den Titel einfließen lassen
+            return f"cycle:{form['title']}"
+
+        self._in_progress.add(fid)
+        digest = hashlib.sha1(form["title"].encode("utf-8"))
+        size = 1
+        for item in form["items"]:
+            digest.update(_item_signature(item).encode("utf-8"))
+            digest.update(str(self.conditions(item)).encode("utf-8"))
+            if item["type"] == "submenu":
+                digest.update(str(self.subtree_hash(item["target"])).encode("utf-8"))
+                size += self.sizes.get(item["target"], 0)
+        self._in_progress.discard(fid)
+
+        self.sizes[fid] = size
+        self.hashes[fid] = digest.hexdigest()
+        return self.hashes[fid]
+
+
+# --- HILFSFUNKTIONEN ---
+
+_UNSTABLE_KEYS = ("target", "question_id", "conditions")
+
+def _item_signature(item):
+    # IDs der Forms (target) und Question-IDs ändern sich zwischen Versionen -> nicht hashen,
+    # Bedingungen kommen aufgelöst über _FormIndex.conditions dazu
+    # repr statt json.dumps: Der Parser baut Items immer in derselben Key-Reihenfolge
+    return repr([(k, v) for k, v in item.items() if k not in _UNSTABLE_KEYS])
+
+def _questions(items):
+    return [item for item in items if item["type"] == "select"]
+
+def _refs(items):
+    return [(item["label"], item["target"]) for item in items if item["type"] == "submenu"]
+
+def _keyed(entries, key_func):
+    """Ordnet Einträge einem Schlüssel zu; Duplikate bekommen einen Zähler."""
+    result = {}
+    seen = {}
+    for entry in entries:
+        key = key_func(entry)
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        result[(key, count)] = entry
+    return result
+
+def _question_entry(path, item):
+    return {
+        "path": path,
+        "variable": item["id"],
+        "label": item["label"],
+        # Echter IFR-Default (Default-Opcode/-Flag), nicht die erste Option
+        "default": item.get("default"),
+        "options": item.get("options", [])
+    }
+
+def _compare_questions(old_item, new_item, old_index, new_index):
+    changes = {}
+    if old_item["label"] != new_item["label"]:
+        changes["label"] = [old_item["label"], new_item["label"]]
+    if old_item.get("default") != new_item.get("default"):
+        changes["default"] = [old_item.get("default"), new_item.get("default")]
+
+    old_opts = old_item.get("options", [])
+    new_opts = new_item.get("options", [])
+    if old_opts != new_opts:
+        added = [opt for opt in new_opts if opt not in old_opts]
+        removed = [opt for opt in old_opts if opt not in new_opts]
+        if added:
+            changes["options_added"] = added
+        if removed:
+            changes["options_removed"] = removed
+        if not added and not removed:
+            changes["options_order"] = [old_opts, new_opts]
+    elif old_item.get("option_values") != new_item.get("option_values"):
+        changes["option_values"] = [old_item.get("option_values"), new_item.get("option_values")]
+    old_conds = old_index.conditions(old_item)
+    new_conds = new_index.conditions(new_item)
+    if old_conds != new_conds:
+        changes["conditions"] = [old_conds, new_conds]
+    return changes
+
+
+def diff_dumps(old_path, new_path):
+    """Parst beide Dumps und liefert den Änderungsbericht (dict)."""
+    old_forms, old_tabs = IfrDumpParser().parse(old_path)
+    new_forms, new_tabs = IfrDumpParser().parse(new_path)
+    return IfrDumpDiff(old_forms, old_tabs, new_forms, new_tabs).run()
+
+def format_report(report):
+    """Menschenlesbare Darstellung des Berichts."""
+    lines = []
+    for entry in report["added"]:
+        lines.append(f"+ {entry['path']} | {entry['label']} [{entry['variable']}] (Default: {entry['default']})")
+    for entry in report["removed"]:
+        lines.append(f"- {entry['path']} | {entry['label']} [{entry['variable']}]")
+    for entry in report["changed"]:
+        lines.append(f"~ {entry['path']} | {entry['label']} [{entry['variable']}]")
+        for field, change in entry["changes"].items():
+            lines.append(f"    {field}: {json.dumps(change, ensure_ascii=False)}")
+
+    summary = report["summary"]
+    lines.append(
+        f"{summary['added']} hinzugefügt, {summary['removed']} entfernt, "
+        f"{summary['changed']} geändert ({summary['forms_skipped']} Forms unverändert übersprungen)"
+    )
+    return "\n".join(lines)
+
+def resolve_input(filename):
+    path = os.path.join(INPUT_DIR, filename)
+    if not os.path.exists(path) and os.path.exists(filename):
+        path = filename
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description="Vergleicht zwei IFR Dumps (alte vs. neue BIOS Version)")
+    parser.add_argument("old_dump", help="Alter Dump (Datei in data/03_ifr_dumps oder Pfad)")
+    parser.add_argument("new_dump", help="Neuer Dump (Datei in data/03_ifr_dumps oder Pfad)")
+    parser.add_argument("--json", dest="json_path", help="Bericht zusätzlich als JSON speichern")
+    args = parser.parse_args()
+
+    old_path = resolve_input(args.old_dump)
+    new_path = resolve_input(args.new_dump)
+    for path in (old_path, new_path):
+        if not os.path.exists(path):
+            print(f"❌ FEHLER: Datei nicht gefunden: {path}")
+            sys.exit(1)
+
+    report = diff_dumps(old_path, new_path)
+    print(format_report(report))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✅ JSON Bericht gespeichert in: {args.json_path}")
+
+if __name__ == "__main__":
+    main()
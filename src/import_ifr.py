@@ -4,6 +4,8 @@ import sys
 import os
 import uuid
 
+from ifr_conditions import ConditionTracker
+
 # --- PFADE KONFIGURATION ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 INPUT_DIR = os.path.join(BASE_DIR, 'data', '03_ifr_dumps')
@@ -18,6 +20,7 @@ class IfrParser:
         self.tabs = []
         self.current_tab = None
         self.current_item = None
+        self.conditions = ConditionTracker()
         
         # Regex Patterns
         self.re_form = re.compile(r'^\s*0x[\dA-F]+\s+Form:\s+(.+?),')
@@ -26,6 +29,8 @@ class IfrParser:
         self.re_setting = re.compile(r'^\s*0x[\dA-F]+\s+(?:Setting|OneOf):\s+(.+?),') 
         self.re_option = re.compile(r'^\s*0x[\dA-F]+\s+(?:OneOfOption|Option):\s+(.+?),')
         self.re_end_options = re.compile(r'^\s*0x[\dA-F]+\s+End of Options')
+        self.re_question_id = re.compile(r'QuestionId:\s*(0x[\dA-Fa-f]+)')
+        self.re_option_value = re.compile(r'Value(?:\s*\(\d+\s*bit\))?:\s*(0x[\dA-Fa-f]+)')
 
     def clean_label(self, text):
         """Bereinigt Strings von ANSI-Codes und Metadaten."""
@@ -62,6 +67,10 @@ class IfrParser:
         if not self.current_tab: 
             return
 
+        # SuppressIf/GrayOutIf/DisableIf inkl. Ausdrücke
+        if self.conditions.process(line):
+            return
+
         # Dispatcher-Liste: Wir probieren alle Handler der Reihe nach
         # Das eliminiert die vielen if-Statements für SonarQube
         item_handlers = [
@@ -84,6 +93,7 @@ class IfrParser:
             self.current_tab = { "name": label, "items": [] }
             self.tabs.append(self.current_tab)
             self.current_item = None
+            self.conditions.reset()
             return True
         return False
 
@@ -112,7 +122,11 @@ class IfrParser:
             label = self.clean_label(match.group(1))
             new_item = self._add_item("item", label, "Select...")
             new_item["options"] = []
+            new_item["option_values"] = []
             new_item["id"] = f"item-{uuid.uuid4().hex[:8]}"
+            match_qid = self.re_question_id.search(line)
+            if match_qid:
+                new_item["question_id"] = match_qid.group(1)
             self.current_item = new_item
             return True
         return False
@@ -125,6 +139,9 @@ class IfrParser:
         if match_opt:
             opt_label = self.clean_label(match_opt.group(1))
             self.current_item["options"].append(opt_label)
+            # Immer anhängen (None ohne Wert), damit option_values parallel zu options bleibt
+            match_val = self.re_option_value.search(line)
+            self.current_item["option_values"].append(match_val.group(1) if match_val else None)
             # Default setzen
             if self.current_item["value"] == "Select...":
                 self.current_item["value"] = opt_label
@@ -139,6 +156,9 @@ class IfrParser:
     def _add_item(self, type_name, label, value):
         """Hilfsmethode um Redundanz beim Hinzufügen zu vermeiden."""
         item = {"type": type_name, "label": label, "value": value}
+        conditions = self.conditions.active()
+        if conditions:
+            item["conditions"] = conditions
         self.current_tab["items"].append(item)
         return item
 
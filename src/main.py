@@ -1,9 +1,11 @@
 import json
 import os
-import uuid
+import hashlib
 import argparse
 import sys
 
+from ifr_conditions import compile_conditions
+
 # --- HELPER KLASSE ---
 
 class BiosHtmlGenerator:
@@ -14,6 +16,10 @@ class BiosHtmlGenerator:
     def __init__(self, project_root):
         self.project_root = project_root
         self.all_views_html = [] # Liste statt String für bessere Performance
+        self.all_view_ids = []   # parallel zu all_views_html
+        self.tab_view_ranges = [] # (start, end) der Views pro Tab, für den Split-Modus
+        self.tab_cond_bases = []  # Erster Target-Index pro Tab (Split-Modus: data-cond tab-lokal)
+        self.cond_offset = 0      # wird beim Rendern von "_cond" abgezogen
         self.template_path = os.path.join(project_root, 'templates', 'bios_template.html')
 
     def load_file(self, path):
@@ -26,25 +32,81 @@ class BiosHtmlGenerator:
 
     def generate(self, config):
         """Hauptmethode zum Erstellen des HTMLs."""
-        # 1. Theme laden
-        theme_name = config.get('theme', 'ami_grey')
-        theme_css = self._load_theme(theme_name)
+        # Hash vor der Generierung: Die Generierung schreibt IDs in die Config
+        config_hash = self._config_hash(config)
 
-        # 2. Template laden
-        template = self.load_file(self.template_path)
+        # 1. SuppressIf/GrayOutIf -> Postfix-Programm + Reverse-Index
+        #    (vor dem Rendern: Zeilen brauchen ihren Target-Index)
+        conditions = compile_conditions(config.get('tabs', []))
 
-        # 3. Tabs und Views generieren
+        # 2. Tabs und Views generieren
         nav_tabs_html = self._generate_tabs(config.get('tabs', []))
 
-        # 4. Zusammenbauen
+        # 3. Zusammenbauen
+        return self._assemble(config, nav_tabs_html, "".join(self.all_views_html),
+                              config, conditions, None, config_hash)
+
+    def generate_split(self, config, chunk_prefix):
+        """
+        Split-Modus: Shell-HTML mit dem ersten Tab + Manifest (View-ID -> Chunk-URL).
+        Alle weiteren Tabs landen als JSON-Chunks mit Content-Hash im Dateinamen.
+        Rückgabe: (html, {dateiname: inhalt})
+        """
+        config_hash = self._config_hash(config)
+        tabs = config.get('tabs', [])
+        conditions = compile_conditions(tabs)
+        nav_tabs_html = self._generate_tabs(tabs, tab_local_conds=True)
+
+        shell_data = dict(config, tabs=list(tabs))
+        shell_views = ""
+        manifest = {}
+        chunks = {}
+
+        for index, (start, end) in enumerate(self.tab_view_ranges):
+            views_html = "".join(self.all_views_html[start:end])
+            if index == 0:
+                shell_views = views_html
+                continue
+
+            # Ohne globale Target-Indizes: Eine neue Bedingung in einem frühen Tab
+            # darf die Dateinamen der späteren Chunks nicht ändern
+            payload = json.dumps({"index": index, "html": views_html, "tab": _without_cond(tabs[index])},
+                                 separators=(',', ':'))
+            digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+            filename = f"tab-{index}.{digest}.json"
+            chunks[filename] = payload
+
+            for view_id in self.all_view_ids[start:end]:
+                manifest[view_id] = f"{chunk_prefix}/{filename}"
+            # Platzhalter, wird beim Laden des Chunks im Browser ersetzt
+            shell_data['tabs'][index] = {"name": tabs[index]['name'], "items": [], "placeholder": True,
+                                         "condBase": self.tab_cond_bases[index]}
+
+        html = self._assemble(config, nav_tabs_html, shell_views, shell_data, conditions, manifest, config_hash)
+        return html, chunks
+
+    def _config_hash(self, config):
+        """Hash der Eingabe-Config = Schlüssel für den Autosave im Browser."""
+        canonical = json.dumps(config, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+    def _assemble(self, config, nav_tabs_html, views_html, data, conditions, manifest, config_hash):
+        """Setzt Theme, Template und die gerenderten Teile zusammen."""
+        theme_css = self._load_theme(config.get('theme', 'ami_grey'))
+        template = self.load_file(self.template_path)
+
         # Wir nutzen .replace() statt f-strings für das große Template, 
         # um SonarQube nicht mit riesigen Strings zu verwirren.
         final_html = template.replace("{TITLE}", config.get('title', 'BIOS SETUP'))
         final_html = final_html.replace("{NAV_TABS}", nav_tabs_html)
-        final_html = final_html.replace("{TAB_CONTENT}", "".join(self.all_views_html))
+        final_html = final_html.replace("{TAB_CONTENT}", views_html)
         final_html = final_html.replace("{FOOTER}", config.get('footer_text', ''))
         final_html = final_html.replace("{THEME_CSS}", theme_css)
-        final_html = final_html.replace("{JSON_DATA}", json.dumps(config))
+        json_data = json.dumps(data)
+        final_html = final_html.replace("{CONFIG_HASH}", config_hash)
+        final_html = final_html.replace("{CONDITIONS}", json.dumps(conditions, separators=(',', ':')))
+        final_html = final_html.replace("{MANIFEST}", json.dumps(manifest))
+        final_html = final_html.replace("{JSON_DATA}", json_data)
         
         return final_html
 
@@ -55,19 +117,25 @@ class BiosHtmlGenerator:
         print(f"⚠️ WARNUNG: Theme '{theme_name}' nicht gefunden. Nutze Standard.")
         return ""
 
-    def _generate_tabs(self, tabs):
+    def _generate_tabs(self, tabs, tab_local_conds=False):
         html_parts = []
         for index, tab in enumerate(tabs):
             tab_id = f"tab-view-{index}"
             # Einfacher f-string ohne Logik
             html_parts.append(f'<div class="nav-item" data-target="{tab_id}">{tab["name"]}</div>\n')
-            self._generate_view(tab_id, tab.get('items', []), tab['name'])
+            if tab_local_conds:
+                # Targets eines Tabs sind zusammenhängend (Compiler läuft Tab für Tab)
+                self.cond_offset = min(_iter_conds(tab.get('items', [])), default=0)
+            self.tab_cond_bases.append(self.cond_offset)
+            start = len(self.all_views_html)
+            self._generate_view(tab_id, tab.get('items', []), tab['name'], str(index))
+            self.tab_view_ranges.append((start, len(self.all_views_html)))
         return "".join(html_parts)
 
-    def _generate_view(self, view_id, items, path_label):
+    def _generate_view(self, view_id, items, path_label, index_path):
         """Erstellt eine View (Seite) und speichert sie im globalen State."""
         # parent_id wurde entfernt, da ungenutzt
-        content_rows = self._generate_items_html(items, path_label)
+        content_rows = self._generate_items_html(items, path_label, index_path)
         
         # HTML Block als Variable definieren um f-string Komplexität zu senken
         view_html = (
@@ -83,30 +151,33 @@ class BiosHtmlGenerator:
             f'</div>\n'
         )
         self.all_views_html.append(view_html)
+        self.all_view_ids.append(view_id)
 
-    def _generate_items_html(self, items, current_path_string):
+    def _generate_items_html(self, items, current_path_string, index_path):
         """Iteriert über Items und delegiert das HTML-Rendering."""
         rows = []
-        for item in items:
-            # ID Sicherstellung
+        for position, item in enumerate(items):
+            # IDs aus dem Index-Pfad (Tab-Item-Item...): gleich bei jedem Build,
+            # damit Chunk-Hashes und Autosave-Schlüssel stabil bleiben
+            item_path = f"{index_path}-{position}"
             if "id" not in item:
-                item["id"] = f"item-{uuid.uuid4().hex[:8]}"
+                item["id"] = f"item-{item_path}"
             
             # Rekursion für Submenüs
-            self._handle_submenu_recursion(item, current_path_string)
+            self._handle_submenu_recursion(item, current_path_string, item_path)
             
             # HTML für diese Zeile bauen
             rows.append(self._render_row(item))
             
         return "".join(rows)
 
-    def _handle_submenu_recursion(self, item, current_path):
+    def _handle_submenu_recursion(self, item, current_path, item_path):
         """Prüft auf Submenü und generiert ggf. rekursiv die neue View."""
         if item.get("type") == "submenu":
-            submenu_id = f"view-{uuid.uuid4().hex[:8]}"
+            submenu_id = f"view-{item_path}"
             item["_target_id"] = submenu_id # Temporär speichern für Renderer
             new_path = f"{current_path} > {item.get('label', '')}"
-            self._generate_view(submenu_id, item.get("items", []), new_path)
+            self._generate_view(submenu_id, item.get("items", []), new_path, item_path)
 
     def _render_row(self, item):
         """Erzeugt das HTML für eine einzelne Zeile (ohne komplexe Logik im String)."""
@@ -120,6 +191,9 @@ class BiosHtmlGenerator:
         
         if "_target_id" in item:
             attrs.append(f'data-target="{item["_target_id"]}"')
+
+        if "_cond" in item:
+            attrs.append(f'data-cond="{item["_cond"] - self.cond_offset}"')
         
         if "options" in item:
             # JSON Escaping separat machen, nicht im f-string
@@ -136,6 +210,21 @@ class BiosHtmlGenerator:
             f'</div>\n'
         )
 
+def _iter_conds(items):
+    """Alle Target-Indizes ("_cond") in Items und Submenüs."""
+    for item in items:
+        if "_cond" in item:
+            yield item["_cond"]
+        yield from _iter_conds(item.get("items", []))
+
+def _without_cond(value):
+    """Kopie ohne "_cond" (nur intern für das Rendern, nicht Teil des Chunks)."""
+    if isinstance(value, dict):
+        return {key: _without_cond(val) for key, val in value.items() if key != "_cond"}
+    if isinstance(value, list):
+        return [_without_cond(val) for val in value]
+    return value
+
 # --- MAIN ENTRY POINT ---
 
 def get_paths(args_file):
@@ -158,10 +247,37 @@ def get_paths(args_file):
     
     return project_root, config_path, output_path
 
+def write_chunks(chunk_dir, chunks):
+    """
+    Schreibt die Chunks. Die Chunks des vorherigen Builds bleiben liegen,
+    damit bereits geöffnete/gecachte Shells keine 404 bekommen.
+    Erst Chunks, die zwei Builds alt sind, werden entfernt.
+    """
+    os.makedirs(chunk_dir, exist_ok=True)
+    build_file = os.path.join(chunk_dir, "build.json")
+    previous = []
+    if os.path.exists(build_file):
+        with open(build_file, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get("chunks", [])
+
+    for filename, payload in chunks.items():
+        with open(os.path.join(chunk_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(payload)
+
+    keep = set(chunks) | set(previous)
+    for old_name in os.listdir(chunk_dir):
+        if old_name.startswith("tab-") and old_name.endswith(".json") and old_name not in keep:
+            os.remove(os.path.join(chunk_dir, old_name))
+    with open(build_file, 'w', encoding='utf-8') as f:
+        json.dump({"chunks": sorted(chunks)}, f)
+    print(f"Schreibe Chunks: {chunk_dir} ({len(chunks)} Dateien)")
+
 def main():
     parser = argparse.ArgumentParser(description="BIOS HTML Generator")
     parser.add_argument("config_file", nargs="?", default="bios_config.json", 
                         help="Datei im config/input Ordner")
+    parser.add_argument("--split", action="store_true",
+                        help="Shell-HTML + JSON-Chunks pro Tab (für Hosting per HTTP)")
     args = parser.parse_args()
 
     project_root, config_path, output_path = get_paths(args.config_file)
@@ -180,7 +296,12 @@ def main():
         
         # 2. Generator starten
         generator = BiosHtmlGenerator(project_root)
-        html_content = generator.generate(config_data)
+        if args.split:
+            chunk_prefix = os.path.splitext(os.path.basename(output_path))[0] + "_chunks"
+            html_content, chunks = generator.generate_split(config_data, chunk_prefix)
+            write_chunks(os.path.join(os.path.dirname(output_path), chunk_prefix), chunks)
+        else:
+            html_content = generator.generate(config_data)
         
         # 3. Schreiben
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -0,0 +1,262 @@
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+from bios_parser import IfrDumpParser
+
+# --- PFADE KONFIGURATION ---
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_DIR = os.path.join(BASE_DIR, 'data', '03_ifr_dumps')
+DEFAULT_DB = os.path.join(BASE_DIR, 'data', 'settings_catalog.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    dump_hash TEXT NOT NULL,
+    source TEXT,
+    ingested_at TEXT
+);
+CREATE TABLE IF NOT EXISTS forms (
+    id INTEGER PRIMARY KEY,
+    board_id INTEGER NOT NULL REFERENCES boards(id),
+    form_id TEXT NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    id INTEGER PRIMARY KEY,
+    board_id INTEGER NOT NULL REFERENCES boards(id),
+    form_ref INTEGER NOT NULL REFERENCES forms(id),
+    label TEXT NOT NULL,
+    variable_id TEXT,
+    question_id TEXT,
+    default_value TEXT
+);
+CREATE TABLE IF NOT EXISTS options (
+    setting_id INTEGER NOT NULL REFERENCES settings(id),
+    position INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_forms_board ON forms(board_id);
+CREATE INDEX IF NOT EXISTS idx_settings_label ON settings(label COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_settings_variable ON settings(variable_id);
+CREATE INDEX IF NOT EXISTS idx_settings_board ON settings(board_id);
+CREATE INDEX IF NOT EXISTS idx_options_setting ON options(setting_id, position);
+"""
+
+# Optionen als ein String, in Dump-Reihenfolge
+OPTIONS_SUBQUERY = """
+    (SELECT group_concat(label, ' | ') FROM
+        (SELECT label FROM options WHERE setting_id = s.id ORDER BY position)) AS options
+"""
+
+RESULT_COLUMNS = f"""
+    SELECT b.name AS board, f.title AS form, s.label, s.variable_id, s.default_value, {OPTIONS_SUBQUERY}
+    FROM settings s
+    JOIN boards b ON b.id = s.board_id
+    JOIN forms f ON f.id = s.form_ref
+"""
+
+
+class SettingsCatalog:
+    """
+    Lokaler SQLite-Katalog über alle importierten BIOS Dumps.
+    Ein Board = ein Dump; unveränderte Dumps werden anhand ihres Hashes übersprungen.
+    """
+    def __init__(self, db_path=DEFAULT_DB):
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.has_fts = self._create_fts()
+
+    def _create_fts(self):
+        """FTS5 ist nicht in jedem SQLite-Build enthalten -> Fallback auf LIKE."""
+        try:
+            self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS settings_fts USING fts5(label)")
+            return True
+        except sqlite3.OperationalError:
+            print("⚠️ WARNUNG: SQLite ohne FTS5. Label-Suche nutzt LIKE.")
+            return False
+
+    def close(self):
+        self.conn.close()
+
+    # --- INGEST ---
+
+    def ingest(self, board, dump_path):
+        """Liest einen Dump ein. False, wenn er unverändert bereits im Katalog ist."""
+        dump_hash = file_hash(dump_path)
+        row = self.conn.execute("SELECT id, dump_hash FROM boards WHERE name = ?", (board,)).fetchone()
+        if row is not None and row["dump_hash"] == dump_hash:
+            return False
+
+        all_forms, _ = IfrDumpParser().parse(dump_path)
+
+        with self.conn:
+            if row is not None:
+                self._delete_board(row["id"])
+            board_id = self.conn.execute(
+                "INSERT INTO boards (name, dump_hash, source, ingested_at) VALUES (?, ?, ?, ?)",
+                (board, dump_hash, os.path.abspath(dump_path), datetime.now().isoformat(timespec="seconds"))
+            ).lastrowid
+            self._insert_forms(board_id, all_forms)
+        return True
+
+    def _insert_forms(self, board_id, all_forms):
+        # IDs selbst vergeben, damit alles per executemany eingefügt werden kann
+        next_form = self._next_id("forms")
+        next_setting = self._next_id("settings")
+
+        form_rows, setting_rows, option_rows = [], [], []
+        for form in all_forms.values():
+            form_ref = next_form
+            next_form += 1
+            form_rows.append((form_ref, board_id, form["id"], form["title"]))
+
+            for item in form["items"]:
+                if item["type"] != "select":
+                    continue
+                setting_rows.append((
+                    next_setting, board_id, form_ref, item["label"],
+                    item.get("id"), item.get("question_id"), item.get("value")
+                ))
+                values = item.get("option_values", [])
+                for position, label in enumerate(item.get("options", [])):
+                    value = values[position] if position < len(values) else None
+                    option_rows.append((next_setting, position, label, value))
+                next_setting += 1
+
+        self.conn.executemany("INSERT INTO forms VALUES (?, ?, ?, ?)", form_rows)
+        self.conn.executemany("INSERT INTO settings VALUES (?, ?, ?, ?, ?, ?, ?)", setting_rows)
+        self.conn.executemany("INSERT INTO options VALUES (?, ?, ?, ?)", option_rows)
+        if self.has_fts:
+            self.conn.executemany("INSERT INTO settings_fts (rowid, label) VALUES (?, ?)",
+                                  ((r[0], r[3]) for r in setting_rows))
+
+    def _delete_board(self, board_id):
+        params = (board_id,)
+        if self.has_fts:
+            self.conn.execute(
+                "DELETE FROM settings_fts WHERE rowid IN (SELECT id FROM settings WHERE board_id = ?)", params)
+        self.conn.execute(
+            "DELETE FROM options WHERE setting_id IN (SELECT id FROM settings WHERE board_id = ?)", params)
+        self.conn.execute("DELETE FROM settings WHERE board_id = ?", params)
+        self.conn.execute("DELETE FROM forms WHERE board_id = ?", params)
+        self.conn.execute("DELETE FROM boards WHERE id = ?", params)
+
+    def _next_id(self, table):
+        return self.conn.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").fetchone()[0]
+
+    # --- ABFRAGEN ---
+
+    def search(self, text, board=None, limit=100):
+        """Sucht Settings per Label (FTS5 Präfix-Suche, sonst LIKE)."""
+        if self.has_fts:
+            terms = " ".join('"' + token.replace('"', '""') + '"*' for token in text.split())
+            if not terms:
+                return []
+            sql = RESULT_COLUMNS + " JOIN settings_fts ON settings_fts.rowid = s.id WHERE settings_fts MATCH ?"
+            params = [terms]
+        else:
+            sql = RESULT_COLUMNS + " WHERE s.label LIKE ?"
+            params = [f"%{text}%"]
+        return self._run(sql, params, board, limit)
+
+    def by_label(self, label, board=None, limit=100):
+        """Exakter Label-Treffer (ohne Groß-/Kleinschreibung), nutzt den Label-Index."""
+        sql = RESULT_COLUMNS + " WHERE s.label = ? COLLATE NOCASE"
+        return self._run(sql, [label], board, limit)
+
+    def by_variable(self, variable_id, board=None, limit=100):
+        sql = RESULT_COLUMNS + " WHERE s.variable_id = ?"
+        return self._run(sql, [variable_id], board, limit)
+
+    def boards(self):
+        sql = """
+            SELECT b.name, b.ingested_at, COUNT(s.id) AS settings
+            FROM boards b LEFT JOIN settings s ON s.board_id = b.id
+            GROUP BY b.id ORDER BY b.name
+        """
+        return [dict(row) for row in self.conn.execute(sql)]
+
+    def _run(self, sql, params, board, limit):
+        if board is not None:
+            sql += " AND b.name = ?"
+            params.append(board)
+        sql += " ORDER BY b.name, s.label LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def resolve_input(filename):
+    path = os.path.join(INPUT_DIR, filename)
+    if not os.path.exists(path) and os.path.exists(filename):
+        path = filename
+    return path
+
+def print_results(rows):
+    for row in rows:
+        print(f"{row['board']} | {row['form']} | {row['label']} [{row['variable_id']}] "
+              f"= {row['default_value']} ({row['options'] or '-'})")
+    print(f"{len(rows)} Treffer")
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite-Katalog aller BIOS Settings")
+    parser.add_argument("--db", default=DEFAULT_DB, help="Pfad zur Katalog-Datenbank")
+    # Kein required=True: erst ab Python 3.7, wir unterstützen 3.6+
+    commands = parser.add_subparsers(dest="command")
+
+    cmd_ingest = commands.add_parser("ingest", help="IFR Dump einlesen")
+    cmd_ingest.add_argument("board", help="Name des Boards")
+    cmd_ingest.add_argument("dump", help="Datei in data/03_ifr_dumps oder Pfad")
+
+    for name, help_text in (("search", "Volltextsuche im Label"),
+                            ("label", "Exaktes Label"),
+                            ("var", "Variable-ID, z.B. 0x26")):
+        cmd = commands.add_parser(name, help=help_text)
+        cmd.add_argument("query")
+        cmd.add_argument("--board", help="Nur dieses Board")
+        cmd.add_argument("--limit", type=int, default=100)
+
+    commands.add_parser("boards", help="Alle Boards im Katalog")
+    args = parser.parse_args()
+    if not args.command:
+        parser.error("Befehl angeben: ingest, search, label, var oder boards")
+
+    catalog = SettingsCatalog(args.db)
+    try:
+        if args.command == "ingest":
+            dump_path = resolve_input(args.dump)
+            if not os.path.exists(dump_path):
+                print(f"❌ FEHLER: Datei nicht gefunden: {dump_path}")
+                sys.exit(1)
+            if catalog.ingest(args.board, dump_path):
+                print(f"✅ {args.board} eingelesen: {dump_path}")
+            else:
+                print(f"⏭️ {args.board} unverändert, übersprungen.")
+        elif args.command == "boards":
+            for board in catalog.boards():
+                print(f"{board['name']}: {board['settings']} Settings ({board['ingested_at']})")
+        else:
+            queries = {"search": catalog.search, "label": catalog.by_label, "var": catalog.by_variable}
+            print_results(queries[args.command](args.query, board=args.board, limit=args.limit))
+    finally:
+        catalog.close()
+
+if __name__ == "__main__":
+    main()
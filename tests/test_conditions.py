@@ -0,0 +1,172 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from bios_engine import BiosEngine
+from bios_parser import IfrDumpParser
+from ifr_conditions import compile_conditions, OP_EQ, OP_IN, OP_NOT
+
+# Dep ist versteckt, solange Mode = Off und NICHT Level = High,
+# und ausgegraut, solange Level = Low.
+DUMP = """\
+0x10 Form: Main (0x1)
+0x11 Ref: Advanced QuestionId: 0x90, FormId: 0x2
+0x20 Form: Advanced (0x2)
+0x21 OneOf: Mode, Variable: 0x26, QuestionId: 0x5, Size: 1
+0x22 Option: Off, Value: 0x0
+0x23 Option: On, Value: 0x1
+0x24 Option: Auto, Value: 0x2
+0x25 End
+0x26 OneOf: Level, Variable: 0x27, QuestionId: 0x6, Size: 1
+0x27 Option: Low, Value: 0x0
+0x28 Option: High, Value: 0x1
+0x29 End
+0x30 Suppress If
+0x31 Variable 0x5 equals value in list (0x0)
+0x32 EqIdVal QuestionId: 0x6, Value: 0x1
+0x33 Not
+0x34 And
+0x35 Gray Out If
+0x36 EqIdValList QuestionId: 0x6, Size: 2, List: 0x0, 0x2
+0x37 OneOf: Dep, Variable: 0x28, QuestionId: 0x7, Size: 1
+0x38 Option: A, Value: 0x0
+0x39 Option: B, Value: 0x1
+0x3A End
+0x3B End If
+0x3C End If
+"""
+
+
+def _engine(tmp_path):
+    dump = tmp_path / "dump.txt"
+    dump.write_text(DUMP, encoding="utf-8")
+    _, root_tabs = IfrDumpParser().parse(str(dump))
+    tabs = [dict(form, name=form["title"]) for form in root_tabs]
+    return BiosEngine({"tabs": tabs})
+
+
+def _labels(engine):
+    return [row["label"] for row in engine.visible_rows(engine.tab_views[0])]
+
+
+def _select(engine, row_index, option_steps):
+    """Setzt die Option einer Zeile über die Tastatur (ab Startzustand des Tabs)."""
+    keys = ['ArrowDown'] * row_index + ['Enter'] + ['ArrowDown'] * option_steps + ['Enter']
+    for key in keys:
+        engine.press(key)
+    engine.switch_tab(0)
+
+
+def _dep_row(engine):
+    return next(row for row in engine.views[engine.tab_views[0]] if row["label"] == "Dep")
+
+
+def test_parser_builds_nested_conditions(tmp_path):
+    engine = _engine(tmp_path)
+    assert engine.id_map["0x26"]["options"] == ["Off", "On", "Auto"]
+    assert engine.id_map["0x26"]["option_values"] == ["0x0", "0x1", "0x2"]
+
+    dep = engine.id_map["0x28"]
+    kinds = [cond["kind"] for cond in dep["conditions"]]
+    assert kinds == ["suppress", "grayout"]
+    assert dep["conditions"][0]["expr"]["op"] == "and"
+    assert dep["conditions"][0]["expr"]["args"][1]["op"] == "not"
+    assert dep["conditions"][1]["expr"] == {"op": "in", "qid": "0x6", "values": ["0x0", "0x2"]}
+
+
+def test_hidden_and_grayed_follow_values(tmp_path):
+    engine = _engine(tmp_path)
+    dep = _dep_row(engine)
+
+    # Start: Mode = Off, Level = Low -> versteckt und ausgegraut
+    assert _labels(engine) == ["Mode", "Level"]
+    assert dep["cond"] in engine.grayed
+
+    # Level = High -> Not(...) falsch -> sichtbar, nicht mehr ausgegraut
+    _select(engine, 1, 1)
+    assert _labels(engine) == ["Mode", "Level", "Dep"]
+    assert dep["cond"] not in engine.grayed
+
+    # Zurück auf Level = Low, aber Mode = On -> sichtbar, wieder ausgegraut
+    engine.reset()
+    _select(engine, 0, 1)
+    assert _labels(engine) == ["Mode", "Level", "Dep"]
+    assert dep["cond"] in engine.grayed
+
+    # Ausgegraute Zeile öffnet kein Options-Popup
+    for key in ['ArrowDown', 'ArrowDown', 'Enter']:
+        engine.press(key)
+    assert not engine.state["modal_open"]
+
+
+def test_question_without_id_still_controls_its_targets():
+    # Q hat nur eine question_id; die ID vergibt der Compiler (Schema wie main.py)
+    config = {"tabs": [{"name": "Main", "items": [
+        {"label": "Q", "type": "select", "value": "Off", "options": ["Off", "On"],
+         "option_values": ["0x0", "0x1"], "question_id": "0x5"},
+        {"label": "D", "type": "select", "value": "A", "options": ["A", "B"],
+         "conditions": [{"kind": "suppress", "expr": {"op": "eq", "qid": "0x5", "value": "0x0"}}]}
+    ]}]}
+    engine = BiosEngine(config)
+    assert engine.conditions["q"] == ["item-0-0"]
+    assert _labels(engine) == ["Q"]
+
+    _select(engine, 0, 1)
+    assert _labels(engine) == ["Q", "D"]
+
+
+def test_disable_if_hides_like_suppress_if(tmp_path):
+    dump = tmp_path / "dump.txt"
+    dump.write_text(
+        "0x10 Form: Main (0x1)\n"
+        "0x11 CheckBox: Turbo, Variable: 0x30, QuestionId: 0x8\n"
+        "0x12 Disable If\n"
+        "0x13 EqIdVal QuestionId: 0x8, Value: 0x0\n"
+        "0x14 CheckBox: Turbo Ratio, Variable: 0x31, QuestionId: 0x9\n"
+        "0x15 End If\n",
+        encoding="utf-8")
+    all_forms, _ = IfrDumpParser().parse(str(dump))
+    engine = BiosEngine({"tabs": [dict(all_forms["0x1"], name="Main")]})
+
+    # Turbo = Disabled -> DisableIf wahr -> Zeile versteckt, nicht nur ausgegraut
+    assert _labels(engine) == ["Turbo"]
+    assert not engine.grayed
+
+    _select(engine, 0, 1)
+    assert _labels(engine) == ["Turbo", "Turbo Ratio"]
+
+
+def test_compiler_output_structure():
+    eq_on = {"op": "eq", "qid": "0x1", "value": "0x1"}
+    not_off = {"op": "not", "args": [{"op": "in", "qid": "0x1", "values": ["0x0"]}]}
+    b = {"label": "B", "type": "select", "id": "0xB", "conditions": [{"kind": "suppress", "expr": eq_on}]}
+    c = {"label": "C", "type": "select", "id": "0xC", "conditions": [{"kind": "suppress", "expr": dict(eq_on)}]}
+    # Gleiche Variable wie B an anderer Stelle, eigene Bedingung
+    b2 = {"label": "B", "type": "select", "id": "0xB", "conditions": [{"kind": "grayout", "expr": not_off}]}
+    tabs = [
+        {"name": "One", "items": [
+            {"label": "A", "type": "select", "id": "0xA", "question_id": "0x1", "value": "Off",
+             "options": ["Off", "On"], "option_values": ["0x0", "0x1"]},
+            b, c
+        ]},
+        {"name": "Two", "items": [b2]}
+    ]
+
+    program = compile_conditions(tabs)
+
+    assert program["q"] == ["0xA"]
+    assert program["m"] == [{"Off": 0, "On": 1}]
+    assert program["v"] == [0]
+    # Identische Ausdrücke von B und C werden nur einmal kompiliert
+    assert program["p"] == [OP_EQ, 0, 1, OP_IN, 0, 1, 0, OP_NOT]
+    assert program["c"] == [[0, 3], [3, 8]]
+    # Ein Target pro Vorkommen, auch bei gleicher ID
+    assert program["t"] == [["0xB", 0, 0], ["0xC", 0, 0], ["0xB", 1, 1]]
+    assert [b["_cond"], c["_cond"], b2["_cond"]] == [0, 1, 2]
+    assert program["x"] == [[0, 1], [2]]
+    assert program["d"] == [[0, 1]]
+
+
+def test_compiler_returns_none_without_conditions():
+    assert compile_conditions([{"name": "One", "items": [{"label": "A", "type": "select"}]}]) is None
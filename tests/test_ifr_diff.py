@@ -0,0 +1,110 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from ifr_diff import diff_dumps
+
+
+def _dump(qids=(0x5, 0x6, 0x7), mode_label="Mode", level_options=("Low", "High"),
+          extra_question=False, extra_submenu=False):
+    """Zwei Tabs (Main, Advanced), Advanced hat ein Submenü (Power)."""
+    q_mode, q_level, q_dep = (hex(q) for q in qids)
+    lines = [
+        "0x10 Form: Main (0x1)",
+        f"0x11 OneOf: {mode_label}, Variable: 0x26, QuestionId: {q_mode}, Size: 1",
+        "0x12 Option: Off, Value: 0x0",
+        "0x13 Option: On, Value: 0x1",
+        "0x14 End",
+        "0x20 Form: Advanced (0x2)",
+        f"0x21 OneOf: Level, Variable: 0x27, QuestionId: {q_level}, Size: 1",
+    ]
+    lines += [f"0x2{2 + i} Option: {label}, Value: {hex(i)}" for i, label in enumerate(level_options)]
+    lines += [
+        "0x29 End",
+        "0x2A Ref: Power QuestionId: 0x90, FormId: 0x3",
+    ]
+    if extra_submenu:
+        lines.append("0x2B Ref: Debug QuestionId: 0x91, FormId: 0x4")
+    lines += [
+        "0x30 Form: Power (0x3)",
+        "0x31 Suppress If",
+        f"0x32 EqIdVal QuestionId: {q_mode}, Value: 0x0",
+        f"0x33 CheckBox: Deep Sleep, Variable: 0x28, QuestionId: {q_dep}",
+        "0x34 End If",
+    ]
+    if extra_question:
+        lines.append("0x35 CheckBox: Wake On LAN, Variable: 0x29, QuestionId: 0x8")
+    if extra_submenu:
+        lines += [
+            "0x40 Form: Debug (0x4)",
+            "0x41 CheckBox: Verbose, Variable: 0x2A, QuestionId: 0x9",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _diff(tmp_path, old_text, new_text):
+    old_path = tmp_path / "old.txt"
+    new_path = tmp_path / "new.txt"
+    old_path.write_text(old_text, encoding="utf-8")
+    new_path.write_text(new_text, encoding="utf-8")
+    return diff_dumps(str(old_path), str(new_path))
+
+
+def _labels(entries):
+    return sorted((entry["path"], entry["label"]) for entry in entries)
+
+
+def test_identical_dump_skips_every_form(tmp_path):
+    report = _diff(tmp_path, _dump(), _dump())
+    assert report["added"] == report["removed"] == report["changed"] == []
+    assert report["summary"]["forms_skipped"] == 3
+
+
+def test_renumbered_question_ids_are_no_change(tmp_path):
+    report = _diff(tmp_path, _dump(), _dump(qids=(0x105, 0x106, 0x107)))
+    assert report["added"] == report["removed"] == report["changed"] == []
+    assert report["summary"]["forms_skipped"] == 3
+
+
+def test_added_and_removed_question(tmp_path):
+    report = _diff(tmp_path, _dump(), _dump(extra_question=True))
+    assert _labels(report["added"]) == [("Advanced > Power", "Wake On LAN")]
+    assert report["removed"] == [] and report["changed"] == []
+
+    report = _diff(tmp_path, _dump(extra_question=True), _dump())
+    assert _labels(report["removed"]) == [("Advanced > Power", "Wake On LAN")]
+
+
+def test_added_and_removed_submenu(tmp_path):
+    report = _diff(tmp_path, _dump(), _dump(extra_submenu=True))
+    assert _labels(report["added"]) == [("Advanced > Debug", "Verbose")]
+    # Main unverändert übersprungen, Power innerhalb von Advanced ebenso
+    assert report["summary"]["forms_skipped"] == 2
+
+    report = _diff(tmp_path, _dump(extra_submenu=True), _dump())
+    assert _labels(report["removed"]) == [("Advanced > Debug", "Verbose")]
+
+
+def test_label_and_option_changes(tmp_path):
+    report = _diff(tmp_path, _dump(), _dump(mode_label="Operating Mode", level_options=("Low", "Max")))
+    # Fragen werden über die Variable zugeordnet, das Label ist nur eine Eigenschaft
+    changes = {entry["variable"]: entry["changes"] for entry in report["changed"]}
+    assert changes["0x26"] == {"label": ["Mode", "Operating Mode"]}
+    assert changes["0x27"] == {"options_added": ["Max"], "options_removed": ["High"]}
+    assert report["added"] == report["removed"] == []
+
+
+def test_condition_change_reports_expressions(tmp_path):
+    new_text = _dump().replace("EqIdVal QuestionId: 0x5, Value: 0x0", "EqIdVal QuestionId: 0x5, Value: 0x1")
+    report = _diff(tmp_path, _dump(), new_text)
+    assert report["changed"][0]["changes"] == {
+        "conditions": ["suppress: 0x26 == 0x0", "suppress: 0x26 == 0x1"]
+    }
+
+
+def test_cyclic_submenus_terminate(tmp_path):
+    # Power verweist auf sich selbst (ein Rückverweis auf Advanced würde den Tab entfernen)
+    cyclic = _dump() + "0x36 Ref: Again QuestionId: 0x92, FormId: 0x3\n"
+    report = _diff(tmp_path, cyclic, cyclic.replace("Deep Sleep", "Deeper Sleep"))
+    assert [entry["changes"] for entry in report["changed"]] == [{"label": ["Deep Sleep", "Deeper Sleep"]}]
@@ -0,0 +1,77 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from settings_catalog import SettingsCatalog
+
+
+def _dump(tmp_path, name, *labels):
+    """Ein Form mit je einem OneOf pro Label."""
+    lines = ["0x10 Form: Main (0x1)"]
+    for index, label in enumerate(labels):
+        lines += [
+            f"0x{index:x}1 OneOf: {label}, Variable: {hex(0x20 + index)}, QuestionId: {hex(0x5 + index)}, Size: 1",
+            f"0x{index:x}2 Option: Off, Value: 0x0",
+            f"0x{index:x}3 Option: On, Value: 0x1",
+            f"0x{index:x}4 End",
+        ]
+    path = tmp_path / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _labels(rows):
+    return sorted(row["label"] for row in rows)
+
+
+def test_unchanged_dump_is_skipped(tmp_path):
+    catalog = SettingsCatalog(":memory:")
+    dump = _dump(tmp_path, "a.txt", "Turbo Mode", "C-States")
+    assert catalog.ingest("A", dump)
+    assert not catalog.ingest("A", dump)
+    assert catalog.boards()[0]["settings"] == 2
+
+
+def test_changed_dump_replaces_rows(tmp_path):
+    catalog = SettingsCatalog(":memory:")
+    catalog.ingest("A", _dump(tmp_path, "a.txt", "Turbo Mode", "C-States"))
+    assert catalog.ingest("A", _dump(tmp_path, "a.txt", "Turbo Mode", "Hyper Threading"))
+
+    assert catalog.search("C-States") == []
+    assert _labels(catalog.search("hyper")) == ["Hyper Threading"]
+    assert _labels(catalog.search("turbo")) == ["Turbo Mode"]
+    assert catalog.boards()[0]["settings"] == 2
+    # Keine verwaisten Zeilen der alten Version
+    count = catalog.conn.execute("SELECT COUNT(*) FROM options").fetchone()[0]
+    assert count == 4
+    if catalog.has_fts:
+        count = catalog.conn.execute("SELECT COUNT(*) FROM settings_fts").fetchone()[0]
+        assert count == 2
+
+
+def test_board_filter(tmp_path):
+    catalog = SettingsCatalog(":memory:")
+    catalog.ingest("A", _dump(tmp_path, "a.txt", "Turbo Mode"))
+    catalog.ingest("B", _dump(tmp_path, "b.txt", "Turbo Mode", "Turbo Ratio"))
+
+    assert [row["board"] for row in catalog.search("turbo mode")] == ["A", "B"]
+    assert _labels(catalog.search("turbo", board="B")) == ["Turbo Mode", "Turbo Ratio"]
+    assert [row["board"] for row in catalog.by_label("turbo mode", board="A")] == ["A"]
+    assert [row["label"] for row in catalog.by_variable("0x21", board="A")] == []
+    assert [row["options"] for row in catalog.by_variable("0x21", board="B")] == ["Off | On"]
+
+
+def test_search_with_special_characters(tmp_path):
+    catalog = SettingsCatalog(":memory:")
+    catalog.ingest("A", _dump(tmp_path, "a.txt", "Turbo Mode", "C-States"))
+
+    for query in ['"', 'Turbo"', '*', 'Turbo*', '(Turbo', 'Turbo)', '-', 'C-States', 'AND', 'Turbo OR',
+                  'NOT Turbo', 'label:Turbo', '^Turbo', 'NEAR(', '']:
+        catalog.search(query)
+
+    assert _labels(catalog.search("C-States")) == ["C-States"]
+    if catalog.has_fts:
+        # Sonderzeichen werden zu Literalen, nicht zu FTS5-Syntax
+        assert _labels(catalog.search("(Turbo")) == ["Turbo Mode"]
+    assert catalog.search("AND") == []
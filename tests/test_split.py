@@ -0,0 +1,95 @@
+import copy
+import json
+import os
+import re
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
+
+from main import BiosHtmlGenerator, write_chunks
+
+
+def _select(label, **extra):
+    return dict({"label": label, "type": "select", "value": "Off", "options": ["Off", "On"],
+                 "option_values": ["0x0", "0x1"]}, **extra)
+
+
+def _suppressed(label, value="0x0"):
+    return _select(label, conditions=[{"kind": "suppress", "expr": {"op": "eq", "qid": "0x5", "value": value}}])
+
+
+def _config(extra_condition=False):
+    main_items = [_select("Mode", question_id="0x5")]
+    if extra_condition:
+        main_items.append(_suppressed("New"))
+    return {"title": "Test", "tabs": [
+        {"name": "Main", "items": main_items},
+        {"name": "Advanced", "items": [
+            _suppressed("Dep"),
+            {"label": "Power", "type": "submenu", "items": [
+                _suppressed("Deep Sleep", "0x1"),
+                {"label": "Debug", "type": "submenu", "items": [_select("Verbose")]}
+            ]}
+        ]},
+        {"name": "Exit", "items": [_suppressed("Save")]}
+    ]}
+
+
+def _split(config):
+    return BiosHtmlGenerator(PROJECT_ROOT).generate_split(config, "out_chunks")
+
+
+def _manifest(html):
+    return json.loads(re.search(r"manifest: (.*), //", html).group(1))
+
+
+def test_manifest_covers_every_view_outside_first_tab():
+    generator = BiosHtmlGenerator(PROJECT_ROOT)
+    html, chunks = generator.generate_split(_config(), "out_chunks")
+    manifest = _manifest(html)
+
+    assert sorted(manifest) == sorted(["tab-view-1", "view-1-1", "view-1-1-1", "tab-view-2"])
+    assert set(manifest.values()) == {"out_chunks/" + name for name in chunks}
+    assert set(generator.all_view_ids) - set(manifest) == {"tab-view-0"}
+    # Submenü-Views liegen im Chunk ihres Tabs
+    tab1 = manifest["tab-view-1"]
+    assert manifest["view-1-1"] == manifest["view-1-1-1"] == tab1
+    assert 'id="view-1-1-1"' in json.loads(chunks[tab1.split("/")[1]])["html"]
+
+
+def test_chunk_names_are_stable():
+    config = _config()
+    _, first = _split(copy.deepcopy(config))
+    _, second = _split(copy.deepcopy(config))
+    assert sorted(first) == sorted(second)
+    assert first == second
+
+
+def test_new_condition_in_earlier_tab_keeps_later_chunk_names():
+    _, before = _split(_config())
+    html, after = _split(_config(extra_condition=True))
+    assert sorted(before) == sorted(after)
+
+    # data-cond im Chunk ist tab-lokal, die Shell kennt den Offset
+    data = json.loads(re.search(r"data: (.*), \n", html).group(1))
+    assert [tab.get("condBase") for tab in data["tabs"]] == [None, 1, 3]
+    exit_chunk = json.loads(after[next(name for name in after if name.startswith("tab-2."))])
+    assert 'data-cond="0"' in exit_chunk["html"]
+    assert "_cond" not in json.dumps(exit_chunk["tab"])
+
+
+def test_write_chunks_keeps_one_previous_build(tmp_path):
+    chunk_dir = str(tmp_path / "out_chunks")
+    builds = [
+        {"tab-1.aaa.json": "1", "tab-2.shared.json": "2"},
+        {"tab-1.bbb.json": "1", "tab-2.shared.json": "2"},
+        {"tab-1.ccc.json": "1", "tab-2.shared.json": "2"},
+    ]
+    for chunks in builds:
+        write_chunks(chunk_dir, chunks)
+
+    files = sorted(name for name in os.listdir(chunk_dir) if name.startswith("tab-"))
+    assert files == ["tab-1.bbb.json", "tab-1.ccc.json", "tab-2.shared.json"]
+    with open(os.path.join(chunk_dir, "build.json"), encoding="utf-8") as f:
+        assert json.load(f) == {"chunks": ["tab-1.ccc.json", "tab-2.shared.json"]}